@@ -0,0 +1,45 @@
+"""Add composite indexes for program review queries
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+
+This migration adds:
+- ix_review_org_updated: program_reviews (org_id, updated_at DESC) so the
+  review list can be filtered by organization and returned newest first
+  straight from the index
+- ix_section_review_key: unique review_sections (review_id, section_key)
+  for section lookups and to enforce one row per section key
+
+validation_scores.review_id is already covered by ix_validation_scores_review_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_review_org_updated',
+        'program_reviews',
+        ['org_id', sa.text('updated_at DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_section_review_key',
+        'review_sections',
+        ['review_id', 'section_key'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_section_review_key', table_name='review_sections')
+    op.drop_index('ix_review_org_updated', table_name='program_reviews')
@@ -0,0 +1,44 @@
+"""Add unique keys for SLO and PSLO assessments
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+
+This migration adds:
+- ix_slo_assessment_course_slo_term: unique slo_assessments
+  (course_id, slo_number, term), one result per CSLO per course per term
+- ix_pslo_assessment_program_pslo_term: unique pslo_assessments
+  (program_id, program_name, pslo_number, term), one result per PSLO per
+  program award per term
+
+These let the SLO seed insert with ON CONFLICT DO NOTHING.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_slo_assessment_course_slo_term',
+        'slo_assessments',
+        ['course_id', 'slo_number', 'term'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_pslo_assessment_program_pslo_term',
+        'pslo_assessments',
+        ['program_id', 'program_name', 'pslo_number', 'term'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pslo_assessment_program_pslo_term', table_name='pslo_assessments')
+    op.drop_index('ix_slo_assessment_course_slo_term', table_name='slo_assessments')
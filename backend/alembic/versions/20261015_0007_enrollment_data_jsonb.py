@@ -0,0 +1,45 @@
+"""Store enrollment snapshot data as JSONB on PostgreSQL
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+
+This migration changes:
+- enrollment_snapshots.data: json -> jsonb on PostgreSQL, so the payload is
+  parsed once on write instead of on every read. Other databases keep JSON.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'enrollment_snapshots',
+        'data',
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        postgresql_using='data::jsonb',
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'enrollment_snapshots',
+        'data',
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        postgresql_using='data::json',
+    )
@@ -2,11 +2,24 @@
 Database configuration and session management.
 """
 
+from contextlib import contextmanager
+from typing import Iterator
+
+import orjson
+from fastapi import Depends
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlmodel import SQLModel, create_engine, Session
 from config import get_settings
 
 settings = get_settings()
 
+
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson (int dict keys become strings, as with json)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create engine with appropriate settings based on database type
 if settings.database_url.startswith("sqlite"):
     # SQLite needs check_same_thread=False for FastAPI
@@ -14,13 +27,22 @@ if settings.database_url.startswith("sqlite"):
         settings.database_url,
         echo=settings.debug,
         connect_args={"check_same_thread": False},
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 else:
-    # PostgreSQL with connection pooling
+    # PostgreSQL with connection pooling. Bulk INSERTs are sent as multi-row
+    # VALUES pages; psycopg2 also batches executemany UPDATE/DELETE.
+    bulk_options = {"insertmanyvalues_page_size": 1000}
+    if make_url(settings.database_url).get_driver_name() == "psycopg2":
+        bulk_options["executemany_mode"] = "values_plus_batch"
     engine = create_engine(
         settings.database_url,
         echo=settings.debug,
         pool_pre_ping=True,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        **bulk_options,
     )
 
 
@@ -33,3 +55,49 @@ def get_session():
     """Dependency to get database session."""
     with Session(engine) as session:
         yield session
+
+
+def get_write_session(session: Session = Depends(get_session)) -> Session:
+    """Dependency for write handlers that serialize what they just committed.
+
+    The request's session is set not to expire objects on commit, so the
+    response can be built without a refresh SELECT. Only use it where every
+    column returned is set client-side: ProgramReview, ReviewSection and
+    ValidationScore have no server defaults or triggers.
+    """
+    session.expire_on_commit = False
+    return session
+
+
+@contextmanager
+def bulk_load_session(engine, **session_kwargs) -> Iterator[Session]:
+    """
+    Yield a Session tuned for a one-off bulk load.
+
+    On SQLite, fsyncs are skipped and the rollback journal and temp tables are
+    kept in memory for the duration, then the previous settings are restored.
+    On PostgreSQL, synchronous_commit is turned off for the load transaction
+    only. A failed load is simply re-run, so durability is not needed here.
+    """
+    with engine.connect() as connection:
+        dialect = connection.dialect.name
+        saved_pragmas = {}
+        if dialect == "sqlite":
+            for pragma in ("synchronous", "journal_mode", "temp_store"):
+                saved_pragmas[pragma] = connection.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+            connection.exec_driver_sql("PRAGMA synchronous=OFF")
+            connection.exec_driver_sql("PRAGMA journal_mode=MEMORY")
+            connection.exec_driver_sql("PRAGMA temp_store=MEMORY")
+            connection.commit()
+
+        try:
+            with Session(bind=connection, **session_kwargs) as session:
+                if dialect == "postgresql":
+                    session.execute(text("SET LOCAL synchronous_commit = off"))
+                yield session
+        finally:
+            if saved_pragmas:
+                connection.rollback()
+                for pragma, value in saved_pragmas.items():
+                    connection.exec_driver_sql(f"PRAGMA {pragma}={value}")
+                connection.commit()
@@ -8,6 +8,7 @@ from enum import Enum
 from typing import Optional, List
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
 
@@ -85,6 +86,10 @@ class SLOAssessment(SQLModel, table=True):
     """
 
     __tablename__ = "slo_assessments"
+    __table_args__ = (
+        # One result per SLO per course per term; lets seeding skip duplicates
+        Index("ix_slo_assessment_course_slo_term", "course_id", "slo_number", "term", unique=True),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
@@ -127,6 +132,14 @@ class PSLOAssessment(SQLModel, table=True):
     """
 
     __tablename__ = "pslo_assessments"
+    __table_args__ = (
+        # One result per PSLO per program award per term; lets seeding skip duplicates
+        Index(
+            "ix_pslo_assessment_program_pslo_term",
+            "program_id", "program_name", "pslo_number", "term",
+            unique=True,
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
@@ -8,6 +8,7 @@ from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel, Column
 from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 
 
 class EnrollmentSnapshot(SQLModel, table=True):
@@ -18,5 +19,6 @@ class EnrollmentSnapshot(SQLModel, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     term: str = Field(index=True, description="e.g., 'Fall 2024', 'Spring 2025'")
     snapshot_date: date
-    data: dict = Field(default_factory=dict, sa_column=Column(JSON))
+    # Binary JSONB on PostgreSQL (parsed once on write), plain JSON elsewhere
+    data: dict = Field(default_factory=dict, sa_column=Column(JSON().with_variant(JSONB(), "postgresql")))
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -8,7 +8,7 @@ from typing import Optional, List, Any
 from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel, Relationship, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index, text
 
 
 class ReviewStatus(str, Enum):
@@ -29,6 +29,10 @@ class ProgramReview(SQLModel, table=True):
     """Main program review document."""
 
     __tablename__ = "program_reviews"
+    __table_args__ = (
+        # Serves list_reviews: filter by org, newest first, without a sort step
+        Index("ix_review_org_updated", "org_id", text("updated_at DESC")),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     org_id: UUID = Field(foreign_key="organizations.id", index=True)
@@ -41,8 +45,16 @@ class ProgramReview(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     # Relationships
-    organization: Optional["Organization"] = Relationship(back_populates="program_reviews")
-    author: Optional["User"] = Relationship(back_populates="authored_reviews")
+    # Organization and author are always serialized alongside the review, so they
+    # are joined-loaded with it.
+    organization: Optional["Organization"] = Relationship(
+        back_populates="program_reviews",
+        sa_relationship_kwargs={"lazy": "joined"},
+    )
+    author: Optional["User"] = Relationship(
+        back_populates="authored_reviews",
+        sa_relationship_kwargs={"lazy": "joined"},
+    )
     sections: List["ReviewSection"] = Relationship(back_populates="review")
     action_plans: List["ActionPlan"] = Relationship(back_populates="review")
     validation_scores: List["ValidationScore"] = Relationship(back_populates="review")
@@ -59,6 +71,10 @@ class ReviewSection(SQLModel, table=True):
     """Individual sections within a program review."""
 
     __tablename__ = "review_sections"
+    __table_args__ = (
+        # One row per section key; also serves the find-or-create lookup
+        Index("ix_section_review_key", "review_id", "section_key", unique=True),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     review_id: UUID = Field(foreign_key="program_reviews.id", index=True)
@@ -9,6 +9,7 @@ import logging
 from typing import Optional, List, Callable
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status, Header
 from pydantic import BaseModel, EmailStr
 from sqlmodel import Session, select
@@ -50,6 +51,35 @@ class UserCreate(BaseModel):
     department_id: Optional[UUID] = None
 
 
+# Authenticated users keyed by identifier (Firebase UID, or user ID in
+# development mode). Entries are detached from their session so they can be
+# shared across requests; the short TTL bounds how long role or department
+# changes take to apply.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _lookup_user(session: Session, firebase_uid: str) -> Optional[User]:
+    """Find a user by Firebase UID, falling back to user ID in development."""
+    # Try by firebase_uid first
+    user = session.exec(
+        select(User).where(User.firebase_uid == firebase_uid)
+    ).first()
+
+    if user:
+        return user
+
+    # Try by user ID (for development convenience)
+    if len(firebase_uid) == 36:  # UUID length
+        try:
+            return session.exec(
+                select(User).where(User.id == firebase_uid)
+            ).first()
+        except Exception:
+            pass
+
+    return None
+
+
 async def get_current_user(
     authorization: Optional[str] = Header(None),
     session: Session = Depends(get_session),
@@ -64,6 +94,10 @@ async def get_current_user(
 
     In development mode (Firebase not configured):
     - Accepts user ID or firebase_uid directly in Authorization header
+
+    FastAPI caches this dependency per request, so role checks that depend on
+    it reuse the same user. Across requests, resolved users are kept in a
+    short-lived in-process cache to skip the lookup SELECT.
     """
     if not authorization:
         raise HTTPException(
@@ -97,26 +131,17 @@ async def get_current_user(
         firebase_uid = token
         logger.debug(f"Development mode: using token as identifier: {firebase_uid}")
 
-    # Look up user in database
+    # Look up user in cache, then database
     if firebase_uid:
-        # Try by firebase_uid first
-        user = session.exec(
-            select(User).where(User.firebase_uid == firebase_uid)
-        ).first()
-
+        user = _user_cache.get(firebase_uid)
         if user:
             return user
 
-        # Try by user ID (for development convenience)
-        if len(firebase_uid) == 36:  # UUID length
-            try:
-                user = session.exec(
-                    select(User).where(User.id == firebase_uid)
-                ).first()
-                if user:
-                    return user
-            except Exception:
-                pass
+        user = _lookup_user(session, firebase_uid)
+        if user:
+            session.expunge(user)
+            _user_cache[firebase_uid] = user
+            return user
 
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -189,6 +214,33 @@ async def login(
     )
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    authorization: Optional[str] = Header(None),
+    firebase: FirebaseService = Depends(get_firebase_service),
+):
+    """
+    Drop the cached user for this token.
+
+    Firebase sign-out happens client-side; this only ensures the backend
+    stops serving the cached profile for the signed-out identity.
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        return
+
+    token = authorization[7:]
+    firebase_uid = token
+    if firebase.is_available:
+        try:
+            decoded_token = await firebase.verify_token(token)
+            firebase_uid = decoded_token.get("uid") if decoded_token else None
+        except ValueError:
+            return
+
+    if firebase_uid:
+        _user_cache.pop(firebase_uid, None)
+
+
 @router.post("/seed", response_model=LoginResponse)
 async def seed_user(
     user_data: UserCreate,
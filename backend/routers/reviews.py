@@ -2,15 +2,18 @@
 Program Review endpoints.
 """
 
+import base64
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel
+from sqlalchemy import tuple_
 from sqlmodel import Session, select
 
-from database import get_session
+from database import get_session, get_write_session
 from models.program_review import ProgramReview, ReviewSection, ReviewStatus, ReviewType, SectionStatus
 from models.organization import Organization
 from models.user import User
@@ -18,6 +21,18 @@ from routers.auth import get_current_user
 
 router = APIRouter()
 
+# Short-lived cache of list_reviews pages for dashboards that poll the list.
+# Keys are (org_id filter, faculty department filter, limit, cursor).
+_review_list_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+
+
+def invalidate_review_list_cache(org_id: UUID) -> None:
+    """Drop cached review lists that could include reviews for org_id."""
+    for key in list(_review_list_cache):
+        org_filter, department_filter = key[0], key[1]
+        if org_filter in (None, org_id) and department_filter in (None, org_id):
+            _review_list_cache.pop(key, None)
+
 
 class ReviewCreate(BaseModel):
     """Create program review request."""
@@ -65,13 +80,14 @@ class SectionResponse(BaseModel):
     updated_at: datetime
 
 
-def _enrich_review(review: ProgramReview, session: Session) -> ReviewResponse:
-    """Helper to enrich a review with org_name and author_name."""
-    org = session.get(Organization, review.org_id)
-    org_name = org.name if org else None
+def _enrich_review(review: ProgramReview) -> ReviewResponse:
+    """Helper to enrich a review with org_name and author_name.
 
-    author = session.get(User, review.author_id)
-    author_name = author.full_name if author else None
+    Organization and author are joined-loaded with the review, so this
+    issues no additional queries.
+    """
+    org_name = review.organization.name if review.organization else None
+    author_name = review.author.full_name if review.author else None
 
     return ReviewResponse(
         id=review.id,
@@ -88,32 +104,103 @@ def _enrich_review(review: ProgramReview, session: Session) -> ReviewResponse:
     )
 
 
+def _encode_cursor(updated_at: datetime, review_id: UUID) -> str:
+    """Encode a review's sort key as an opaque pagination cursor."""
+    raw = f"{updated_at.isoformat()}|{review_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a pagination cursor back into (updated_at, id)."""
+    try:
+        updated_at, review_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(updated_at), UUID(review_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
 @router.get("", response_model=List[ReviewResponse])
 async def list_reviews(
+    response: Response,
     org_id: Optional[UUID] = None,
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Items per page; omit for all"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header from the previous page"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
-    """List program reviews, optionally filtered by organization."""
-    query = select(ProgramReview)
+    """List program reviews, optionally filtered by organization.
+
+    Results are ordered by (updated_at, id), newest first. When limit is given
+    and more rows remain, the cursor for the next page is returned in the
+    X-Next-Cursor response header.
+    """
+    # Faculty can only see their department's reviews
+    department_filter = None
+    if current_user.role == "faculty" and current_user.department_id:
+        department_filter = current_user.department_id
+
+    cache_key = (org_id, department_filter, limit, cursor)
+    cached = _review_list_cache.get(cache_key)
+    if cached is not None:
+        items, next_cursor = cached
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return items
+
+    # Select only the columns ReviewResponse needs, joining names in directly
+    query = (
+        select(
+            ProgramReview.id,
+            ProgramReview.org_id,
+            Organization.name.label("org_name"),
+            ProgramReview.author_id,
+            User.full_name.label("author_name"),
+            ProgramReview.cycle_year,
+            ProgramReview.review_type,
+            ProgramReview.status,
+            ProgramReview.content,
+            ProgramReview.created_at,
+            ProgramReview.updated_at,
+        )
+        .outerjoin(Organization, Organization.id == ProgramReview.org_id)
+        .outerjoin(User, User.id == ProgramReview.author_id)
+    )
 
     if org_id:
         query = query.where(ProgramReview.org_id == org_id)
 
-    # Faculty can only see their department's reviews
-    if current_user.role == "faculty" and current_user.department_id:
-        query = query.where(ProgramReview.org_id == current_user.department_id)
+    if department_filter:
+        query = query.where(ProgramReview.org_id == department_filter)
+
+    if cursor:
+        query = query.where(
+            tuple_(ProgramReview.updated_at, ProgramReview.id) < _decode_cursor(cursor)
+        )
 
-    reviews = session.exec(query.order_by(ProgramReview.updated_at.desc())).all()
+    query = query.order_by(ProgramReview.updated_at.desc(), ProgramReview.id.desc())
+    if limit:
+        # Fetch one extra row to learn whether another page exists
+        query = query.limit(limit + 1)
+    rows = session.exec(query).all()
 
-    # Enrich reviews with org_name and author_name
-    return [_enrich_review(review, session) for review in reviews]
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].updated_at, rows[-1].id)
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    items = [ReviewResponse(**row._mapping) for row in rows]
+    _review_list_cache[cache_key] = (items, next_cursor)
+    return items
 
 
 @router.post("", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
 async def create_review(
     review_data: ReviewCreate,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_write_session),
     current_user: User = Depends(get_current_user),
 ):
     """Create a new program review."""
@@ -123,8 +210,8 @@ async def create_review(
     )
     session.add(review)
     session.commit()
-    session.refresh(review)
-    return _enrich_review(review, session)
+    invalidate_review_list_cache(review.org_id)
+    return _enrich_review(review)
 
 
 @router.get("/{review_id}", response_model=ReviewResponse)
@@ -140,14 +227,14 @@ async def get_review(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Review not found",
         )
-    return _enrich_review(review, session)
+    return _enrich_review(review)
 
 
 @router.patch("/{review_id}", response_model=ReviewResponse)
 async def update_review(
     review_id: UUID,
     review_data: ReviewUpdate,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_write_session),
     current_user: User = Depends(get_current_user),
 ):
     """Update a program review."""
@@ -159,21 +246,20 @@ async def update_review(
         )
 
     # Update fields
-    update_data = review_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(review, key, value)
-
-    review.updated_at = datetime.utcnow()
+    review.sqlmodel_update(
+        review_data.model_dump(exclude_unset=True),
+        update={"updated_at": datetime.utcnow()},
+    )
     session.add(review)
     session.commit()
-    session.refresh(review)
-    return _enrich_review(review, session)
+    invalidate_review_list_cache(review.org_id)
+    return _enrich_review(review)
 
 
 @router.post("/{review_id}/submit", response_model=ReviewResponse)
 async def submit_review(
     review_id: UUID,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_write_session),
     current_user: User = Depends(get_current_user),
 ):
     """Submit a program review for approval."""
@@ -194,8 +280,8 @@ async def submit_review(
     review.updated_at = datetime.utcnow()
     session.add(review)
     session.commit()
-    session.refresh(review)
-    return _enrich_review(review, session)
+    invalidate_review_list_cache(review.org_id)
+    return _enrich_review(review)
 
 
 @router.get("/{review_id}/sections", response_model=List[SectionResponse])
@@ -206,9 +292,17 @@ async def list_sections(
 ):
     """List all sections for a program review."""
     sections = session.exec(
-        select(ReviewSection).where(ReviewSection.review_id == review_id)
+        select(
+            ReviewSection.id,
+            ReviewSection.review_id,
+            ReviewSection.section_key,
+            ReviewSection.status,
+            ReviewSection.content,
+            ReviewSection.ai_drafts,
+            ReviewSection.updated_at,
+        ).where(ReviewSection.review_id == review_id)
     ).all()
-    return sections
+    return [SectionResponse(**section._mapping) for section in sections]
 
 
 @router.patch("/{review_id}/sections/{section_key}", response_model=SectionResponse)
@@ -216,7 +310,7 @@ async def update_section(
     review_id: UUID,
     section_key: str,
     section_data: SectionUpdate,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_write_session),
     current_user: User = Depends(get_current_user),
 ):
     """Update or create a review section."""
@@ -240,12 +334,11 @@ async def update_section(
         section = ReviewSection(review_id=review_id, section_key=section_key)
 
     # Update fields
-    update_data = section_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(section, key, value)
-
-    section.updated_at = datetime.utcnow()
+    section.sqlmodel_update(
+        section_data.model_dump(exclude_unset=True),
+        update={"updated_at": datetime.utcnow()},
+    )
     session.add(section)
     session.commit()
-    session.refresh(section)
+    invalidate_review_list_cache(review.org_id)
     return section
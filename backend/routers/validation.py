@@ -10,11 +10,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
-from database import get_session
+from database import get_session, get_write_session
 from models.validation import ValidationScore
 from models.program_review import ProgramReview, ReviewStatus
 from models.user import User, UserRole
 from routers.auth import get_current_user
+from routers.reviews import invalidate_review_list_cache
 
 router = APIRouter()
 
@@ -39,7 +40,7 @@ class ValidationResponse(BaseModel):
 async def validate_review(
     review_id: UUID,
     validation_data: ValidationCreate,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_write_session),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -82,7 +83,7 @@ async def validate_review(
     session.add(review)
 
     session.commit()
-    session.refresh(validation)
+    invalidate_review_list_cache(review.org_id)
 
     return ValidationResponse(
         id=validation.id,
@@ -102,20 +103,17 @@ async def get_validation_scores(
 ):
     """Get all validation scores for a review."""
     scores = session.exec(
-        select(ValidationScore).where(ValidationScore.review_id == review_id)
+        select(
+            ValidationScore.id,
+            ValidationScore.review_id,
+            ValidationScore.validator_id,
+            ValidationScore.rubric_scores,
+            ValidationScore.comments,
+            ValidationScore.created_at,
+        ).where(ValidationScore.review_id == review_id)
     ).all()
 
-    return [
-        ValidationResponse(
-            id=s.id,
-            review_id=s.review_id,
-            validator_id=s.validator_id,
-            rubric_scores=s.rubric_scores,
-            comments=s.comments,
-            created_at=s.created_at,
-        )
-        for s in scores
-    ]
+    return [ValidationResponse(**s._mapping) for s in scores]
 
 
 @router.post("/reviews/{review_id}/approve", response_model=dict)
@@ -151,5 +149,6 @@ async def approve_review(
     review.updated_at = datetime.utcnow()
     session.add(review)
     session.commit()
+    invalidate_review_list_cache(review.org_id)
 
     return {"message": "Review approved", "review_id": str(review_id)}
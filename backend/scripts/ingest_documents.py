@@ -23,9 +23,14 @@ Output:
     to be saved in GEMINI_FILE_SEARCH_STORE_NAME environment variable.
 """
 
+import asyncio
+import hashlib
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -116,7 +121,28 @@ ACCJC_DOCUMENTS = [
 # Combine all documents
 ALL_DOCUMENTS = ISMP_DOCUMENTS + ACCJC_DOCUMENTS
 
+# Uploads are IO-bound, so run them all at once
+MAX_UPLOAD_WORKERS = 8
 
+# Operation polling: back off from a short first poll up to a low ceiling,
+# dropping back to the short poll whenever the operation reports progress,
+# and give up after a fixed time budget
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 2.0
+POLL_BACKOFF = 1.5
+UPLOAD_TIMEOUT = 180  # 3 minutes
+
+# Serializes output from concurrent uploads so lines don't interleave
+_print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    """Print a message without interleaving with other upload threads."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory (calipar repo root)."""
     # Script is in backend/scripts/, go up 3 levels to get repo root
@@ -124,6 +150,7 @@ def get_project_root() -> Path:
     return script_dir.parent.parent.parent.parent
 
 
+@lru_cache(maxsize=None)
 def find_document(relative_path: str) -> Optional[Path]:
     """Find a document by relative path from project root."""
     project_root = get_project_root()
@@ -145,6 +172,38 @@ def find_document(relative_path: str) -> Optional[Path]:
     return None
 
 
+def file_sha256(file_path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's contents."""
+    with open(file_path, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def list_existing_documents(client: genai.Client, store_name: str) -> dict:
+    """Map display name -> [(document name, sha256 or None)] for documents already in the store."""
+    documents = {}
+    try:
+        for document in client.file_search_stores.documents.list(parent=store_name):
+            digest = next(
+                (item.string_value for item in document.custom_metadata or [] if item.key == "sha256"),
+                None,
+            )
+            documents.setdefault(document.display_name, []).append((document.name, digest))
+    except Exception as e:
+        print(f"  ERROR listing documents: {e}")
+    return documents
+
+
+def delete_documents(client: genai.Client, document_names: list) -> None:
+    """Remove superseded versions of a document from the store."""
+    for name in document_names:
+        try:
+            # force also deletes the document's chunks
+            client.file_search_stores.documents.delete(name=name, config={"force": True})
+            log(f"    Removed previous version: {name}")
+        except Exception as e:
+            log(f"    ERROR removing {name}: {e}")
+
+
 def create_file_search_store(client: genai.Client, store_name: str) -> str:
     """Create a new File Search store."""
     print(f"\nCreating File Search store: {store_name}")
@@ -180,48 +239,64 @@ def upload_document(
     display_name: str,
     metadata: list,
 ) -> bool:
-    """Upload a document to the File Search store."""
-    print(f"\n  Uploading: {display_name}")
-    print(f"    File: {file_path}")
+    """
+    Upload a document to the File Search store.
+
+    Returns True only once the upload operation has finished without an
+    error; an upload still running at UPLOAD_TIMEOUT counts as not done.
+    """
+    log(f"\n  Uploading: {display_name}\n    File: {file_path}")
 
     try:
-        # Upload file to File Search store directly
-        operation = client.file_search_stores.upload_to_file_search_store(
-            file=str(file_path),
-            file_search_store_name=store_name,
-            config={
-                "display_name": display_name,
-                "chunking_config": {
-                    "white_space_config": {
-                        "max_tokens_per_chunk": 512,
-                        "max_overlap_tokens": 50,
-                    }
+        # Upload file to File Search store directly, streaming from an open
+        # handle so the PDF is sent in chunks rather than held in memory
+        with open(file_path, "rb") as fh:
+            operation = client.file_search_stores.upload_to_file_search_store(
+                file=fh,
+                file_search_store_name=store_name,
+                config={
+                    "display_name": display_name,
+                    "mime_type": "application/pdf",
+                    "custom_metadata": metadata,
+                    "chunking_config": {
+                        "white_space_config": {
+                            "max_tokens_per_chunk": 512,
+                            "max_overlap_tokens": 50,
+                        }
+                    },
                 },
-            },
-        )
+            )
 
         # Wait for operation to complete
-        print("    Processing...", end="", flush=True)
-        wait_count = 0
+        delay = POLL_INITIAL_DELAY
+        deadline = time.monotonic() + UPLOAD_TIMEOUT
         while not operation.done:
-            time.sleep(3)
+            if time.monotonic() >= deadline:
+                log(f"    WARNING: {display_name} still processing after {UPLOAD_TIMEOUT}s; "
+                    "keeping any previous version")
+                return False
+            time.sleep(delay)
+            previous_state = operation.metadata
             operation = client.operations.get(operation)
-            wait_count += 1
-            print(".", end="", flush=True)
-            if wait_count > 60:  # 3 minute timeout
-                print("\n    WARNING: Operation taking too long, continuing...")
-                break
+            if operation.metadata != previous_state:
+                delay = POLL_INITIAL_DELAY
+            else:
+                delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+
+        if operation.error:
+            log(f"\n    ERROR ({display_name}): upload failed: {operation.error}")
+            return False
 
-        print(" Done!")
+        log(f"  Done: {display_name}")
         return True
 
     except Exception as e:
-        print(f"\n    ERROR: {e}")
+        log(f"\n    ERROR ({display_name}): {e}")
         return False
 
 
 def test_file_search(client: genai.Client, store_name: str) -> None:
-    """Test the File Search store with a sample query."""
+    """Test the File Search store with sample queries, run concurrently."""
     print("\n" + "=" * 60)
     print("TESTING FILE SEARCH")
     print("=" * 60)
@@ -232,26 +307,42 @@ def test_file_search(client: genai.Client, store_name: str) -> None:
         "What is the course completion rate target for CCC?",
     ]
 
-    for query in test_queries:
+    # Shared by every query
+    config = types.GenerateContentConfig(
+        tools=[
+            types.Tool(
+                file_search=types.FileSearch(
+                    file_search_store_names=[store_name]
+                )
+            )
+        ],
+        temperature=0.2,
+    )
+
+    async def run_query(query: str):
+        return await client.aio.models.generate_content(
+            model="gemini-2.0-flash",
+            contents=query,
+            config=config,
+        )
+
+    async def run_all():
+        return await asyncio.gather(
+            *(run_query(query) for query in test_queries),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run_all())
+
+    for query, response in zip(test_queries, results):
         print(f"\nQuery: {query}")
         print("-" * 40)
 
-        try:
-            response = client.models.generate_content(
-                model="gemini-2.0-flash",
-                contents=query,
-                config=types.GenerateContentConfig(
-                    tools=[
-                        types.Tool(
-                            file_search=types.FileSearch(
-                                file_search_store_names=[store_name]
-                            )
-                        )
-                    ],
-                    temperature=0.2,
-                ),
-            )
+        if isinstance(response, Exception):
+            print(f"ERROR: {response}")
+            continue
 
+        try:
             print(f"Response: {response.text[:500]}...")
 
             # Check for citations
@@ -306,7 +397,13 @@ def main():
 
     success_count = 0
     fail_count = 0
+    unchanged_count = 0
 
+    # Documents are tagged with a content hash so unchanged files are not
+    # re-ingested; other versions under the same display name are stale
+    existing_documents = list_existing_documents(client, full_store_name)
+
+    to_upload = []
     for doc in ALL_DOCUMENTS:
         file_path = find_document(doc["path"])
 
@@ -316,29 +413,53 @@ def main():
             fail_count += 1
             continue
 
-        success = upload_document(
-            client=client,
-            store_name=full_store_name,
-            file_path=file_path,
-            display_name=doc["display_name"],
-            metadata=doc.get("metadata", []),
-        )
+        digest = file_sha256(file_path)
+        versions = existing_documents.get(doc["display_name"], [])
+        stale = [name for name, version_digest in versions if version_digest != digest]
+        if len(stale) < len(versions):
+            print(f"\n  UNCHANGED: {doc['display_name']}")
+            unchanged_count += 1
+            delete_documents(client, stale)
+            continue
 
-        if success:
-            success_count += 1
-        else:
-            fail_count += 1
+        metadata = doc.get("metadata", []) + [{"key": "sha256", "string_value": digest}]
+        to_upload.append((doc, file_path, metadata, stale))
+
+    # Upload concurrently; total time is the slowest document, not the sum.
+    # A changed document's previous versions are removed only after the new
+    # upload has finished without error, so a failed or unfinished upload
+    # never leaves the store without the document.
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                upload_document,
+                client=client,
+                store_name=full_store_name,
+                file_path=file_path,
+                display_name=doc["display_name"],
+                metadata=metadata,
+            ): stale
+            for doc, file_path, metadata, stale in to_upload
+        }
+
+        for future in as_completed(futures):
+            if future.result():
+                success_count += 1
+                delete_documents(client, futures[future])
+            else:
+                fail_count += 1
 
     # Summary
     print("\n" + "=" * 60)
     print("INGESTION SUMMARY")
     print("=" * 60)
     print(f"  Successful: {success_count}")
+    print(f"  Unchanged: {unchanged_count}")
     print(f"  Failed: {fail_count}")
     print(f"  File Search Store: {full_store_name}")
 
     # Test the store
-    if success_count > 0:
+    if success_count > 0 or unchanged_count > 0:
         test_file_search(client, full_store_name)
 
     # Output for .env
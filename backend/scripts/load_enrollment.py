@@ -6,7 +6,7 @@ Parses Excel enrollment files from CCC and loads them into the enrollment_snapsh
 Supports Fall, Spring, Summer, and Winter term data.
 
 Usage:
-    python -m scripts.load_enrollment [--data-dir PATH] [--dry-run]
+    python -m scripts.load_enrollment [--data-dir PATH] [--dry-run] [--batch-size N]
 
 Examples:
     # Load from default reference data location
@@ -24,11 +24,14 @@ import logging
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 import pandas as pd
+from python_calamine import CalamineWorkbook
+from sqlalchemy import tuple_, update
 from sqlmodel import Session, select
 
 # Add parent directory to path for imports
@@ -46,6 +49,35 @@ logger = logging.getLogger(__name__)
 # Default data directory (relative to project root)
 DEFAULT_DATA_DIR = Path(__file__).parent.parent.parent.parent / "reference_data" / "enrollment"
 
+# Workbook extensions picked up from the data directory
+EXCEL_SUFFIXES = {".xlsx", ".xls"}
+
+# Snapshots written per transaction; each carries a full JSON payload
+DEFAULT_BATCH_SIZE = 50
+
+# Filename patterns, tried in order by parse_term_from_filename
+_TERM_PAREN_RE = re.compile(r"(\w+)_(\d{4})\s*\((\d{1,2})-(\d{1,2})-(\d{2})\)")
+_TERM_USCORE_RE = re.compile(r"(\w+)_(\d{4})_(\d{1,2})-(\d{1,2})-(\d{2})")
+_TERM_FALLBACK_RE = re.compile(r"(\w+)_(\d{4})")
+
+# Column-name substrings that identify each enrollment field (matched against
+# the lower-cased header)
+COLUMN_MAPPING = {
+    "enrollment": ["enrollment", "enrolled", "enrl", "enroll", "total_enrollment"],
+    "seats": ["seats", "cap", "capacity", "total_seats"],
+    "sections": ["sections", "section", "sec", "total_sections"],
+    "fill_rate": ["fill_rate", "fill rate", "fill %", "fill", "fill_pct"],
+    "mode": ["mode", "mode of instruction", "modality", "instruction_mode", "mode_of_instruction"],
+    "term_length": ["term_length", "term length", "session", "term", "length"],
+    "discipline": ["discipline", "dept", "department", "subject", "subj", "subject_area"],
+}
+
+# One alternation regex per field, longest pattern first
+_COLUMN_KEY_RES = [
+    (key, re.compile("|".join(sorted(map(re.escape, patterns), key=len, reverse=True))))
+    for key, patterns in COLUMN_MAPPING.items()
+]
+
 
 def parse_term_from_filename(filename: str) -> Tuple[str, date]:
     """
@@ -63,7 +95,7 @@ def parse_term_from_filename(filename: str) -> Tuple[str, date]:
     name = filename.replace(".xlsx", "").replace(".xls", "")
 
     # Try pattern with parentheses: "Fall_2024 (11-13-24)"
-    match = re.match(r"(\w+)_(\d{4})\s*\((\d{1,2})-(\d{1,2})-(\d{2})\)", name)
+    match = _TERM_PAREN_RE.match(name)
     if match:
         term_type = match.group(1)
         term_year = match.group(2)
@@ -74,7 +106,7 @@ def parse_term_from_filename(filename: str) -> Tuple[str, date]:
         return f"{term_type} {term_year}", date(year, month, day)
 
     # Try pattern with underscores: "Spring_2025_5-7-25"
-    match = re.match(r"(\w+)_(\d{4})_(\d{1,2})-(\d{1,2})-(\d{2})", name)
+    match = _TERM_USCORE_RE.match(name)
     if match:
         term_type = match.group(1)
         term_year = match.group(2)
@@ -85,7 +117,7 @@ def parse_term_from_filename(filename: str) -> Tuple[str, date]:
         return f"{term_type} {term_year}", date(year, month, day)
 
     # Fallback: just extract term info
-    match = re.match(r"(\w+)_(\d{4})", name)
+    match = _TERM_FALLBACK_RE.match(name)
     if match:
         term_type = match.group(1)
         term_year = match.group(2)
@@ -94,6 +126,33 @@ def parse_term_from_filename(filename: str) -> Tuple[str, date]:
     raise ValueError(f"Could not parse term from filename: {filename}")
 
 
+def find_main_sheet(workbook: CalamineWorkbook) -> str:
+    """
+    Return the first sheet with substantial data (more than 10 rows below the
+    header), falling back to the first sheet.
+
+    Uses each sheet's used-range height rather than reading it into pandas.
+    """
+    for sheet_name in workbook.sheet_names:
+        if workbook.get_sheet_by_name(sheet_name).height - 1 > 10:
+            return sheet_name
+    return workbook.sheet_names[0]
+
+
+def sum_by_group(
+    df: pd.DataFrame, group_col: str, num_cols: List[str]
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (group label, {column: total}) for each non-null value of group_col.
+
+    Groups keep first-appearance order (sort=False) and are iterated as plain
+    tuples rather than materialised through to_dict("index").
+    """
+    grouped = df.groupby(group_col, sort=False, observed=True, dropna=True)[num_cols].sum()
+    for key, *totals in grouped.itertuples(index=True, name=None):
+        yield str(key).strip(), dict(zip(num_cols, totals))
+
+
 def parse_enrollment_excel(filepath: Path) -> Dict[str, Any]:
     """
     Parse an enrollment Excel file and extract structured data.
@@ -108,28 +167,27 @@ def parse_enrollment_excel(filepath: Path) -> Dict[str, Any]:
     logger.info(f"Parsing: {filepath.name}")
 
     try:
-        # Read the Excel file - try multiple sheet approaches
-        excel_file = pd.ExcelFile(filepath)
-        sheet_names = excel_file.sheet_names
-        logger.debug(f"Found sheets: {sheet_names}")
-
-        # Try to find the main data sheet
-        df = None
-        for sheet_name in sheet_names:
-            temp_df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            if len(temp_df) > 10:  # Assume main sheet has substantial data
-                df = temp_df
-                logger.debug(f"Using sheet: {sheet_name}")
-                break
-
-        if df is None:
-            df = pd.read_excel(excel_file, sheet_name=0)
-
-        # Clean column names
-        df.columns = df.columns.str.strip()
-
-        # Log available columns for debugging
-        logger.debug(f"Columns: {list(df.columns)}")
+        # Read the Excel file - try multiple sheet approaches. The calamine
+        # engine (Rust) parses workbooks far faster than openpyxl.
+        excel_file = pd.ExcelFile(filepath, engine="calamine")
+        logger.debug("Found sheets: %s", excel_file.sheet_names)
+
+        # Try to find the main data sheet from sheet dimensions alone, so
+        # only the chosen sheet is materialised as a DataFrame. read_excel
+        # keeps pandas' cell conversion (integral floats become ints) and
+        # header handling (blank and duplicate names are made unique).
+        main_sheet = find_main_sheet(excel_file.book)
+        logger.debug("Using sheet: %s", main_sheet)
+        df = pd.read_excel(excel_file, sheet_name=main_sheet)
+
+        # Clean column names (an empty sheet has a RangeIndex, and headers
+        # may be numbers)
+        df.columns = df.columns.astype(str).str.strip()
+
+        # Log available columns for debugging (the list is only built when
+        # debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Columns: %s", df.columns.tolist())
 
         # Initialize result structure
         result = {
@@ -141,58 +199,48 @@ def parse_enrollment_excel(filepath: Path) -> Dict[str, Any]:
             "raw_records_count": 0,
         }
 
-        # Try to identify common enrollment columns
-        enrollment_col = None
-        seats_col = None
-        sections_col = None
-        fill_rate_col = None
-        mode_col = None
-        term_length_col = None
-        discipline_col = None
-
-        # Map columns by common names
-        column_mapping = {
-            "enrollment": ["enrollment", "enrolled", "enrl", "enroll", "total_enrollment"],
-            "seats": ["seats", "cap", "capacity", "total_seats"],
-            "sections": ["sections", "section", "sec", "total_sections"],
-            "fill_rate": ["fill_rate", "fill rate", "fill %", "fill", "fill_pct"],
-            "mode": ["mode", "mode of instruction", "modality", "instruction_mode", "mode_of_instruction"],
-            "term_length": ["term_length", "term length", "session", "term", "length"],
-            "discipline": ["discipline", "dept", "department", "subject", "subj", "subject_area"],
-        }
-
+        # Identify common enrollment columns in a single pass: each key keeps
+        # the first column whose header contains one of its patterns. A column
+        # may fill several keys (e.g. 'Enrl Cap' is both enrollment and seats).
+        assigned: Dict[str, str] = {}
         for col in df.columns:
             col_lower = col.lower().strip()
-            for key, patterns in column_mapping.items():
-                if any(p in col_lower for p in patterns):
-                    if key == "enrollment" and enrollment_col is None:
-                        enrollment_col = col
-                    elif key == "seats" and seats_col is None:
-                        seats_col = col
-                    elif key == "sections" and sections_col is None:
-                        sections_col = col
-                    elif key == "fill_rate" and fill_rate_col is None:
-                        fill_rate_col = col
-                    elif key == "mode" and mode_col is None:
-                        mode_col = col
-                    elif key == "term_length" and term_length_col is None:
-                        term_length_col = col
-                    elif key == "discipline" and discipline_col is None:
-                        discipline_col = col
-
-        logger.debug(f"Identified columns - enrollment: {enrollment_col}, seats: {seats_col}, "
-                    f"sections: {sections_col}, mode: {mode_col}, discipline: {discipline_col}")
-
-        # Calculate summary statistics
+            for key, pattern in _COLUMN_KEY_RES:
+                if key not in assigned and pattern.search(col_lower):
+                    assigned[key] = col
+
+        enrollment_col = assigned.get("enrollment")
+        seats_col = assigned.get("seats")
+        sections_col = assigned.get("sections")
+        fill_rate_col = assigned.get("fill_rate")
+        mode_col = assigned.get("mode")
+        term_length_col = assigned.get("term_length")
+        discipline_col = assigned.get("discipline")
+
+        logger.debug("Identified columns - enrollment: %s, seats: %s, sections: %s, mode: %s, discipline: %s",
+                     enrollment_col, seats_col, sections_col, mode_col, discipline_col)
+
+        # Coerce the numeric columns once, up front, skipping any the reader
+        # already returned with a numeric dtype
+        num_cols = list(dict.fromkeys(c for c in (enrollment_col, seats_col, sections_col) if c))
+        already_numeric = set(df[num_cols].select_dtypes("number").columns)
+        to_coerce = [c for c in num_cols if c not in already_numeric]
+        if to_coerce:
+            df[to_coerce] = df[to_coerce].apply(pd.to_numeric, errors="coerce")
+
+        # Group on categorical codes rather than hashing Python strings
+        for col in (mode_col, term_length_col, discipline_col):
+            if col:
+                df[col] = df[col].astype("category")
+
+        # Calculate summary statistics in one pass over the numeric columns
+        totals = df[num_cols].sum()
         if enrollment_col:
-            df[enrollment_col] = pd.to_numeric(df[enrollment_col], errors="coerce")
-            result["summary"]["total_enrollment"] = int(df[enrollment_col].sum())
+            result["summary"]["total_enrollment"] = int(totals[enrollment_col])
         if seats_col:
-            df[seats_col] = pd.to_numeric(df[seats_col], errors="coerce")
-            result["summary"]["total_seats"] = int(df[seats_col].sum())
+            result["summary"]["total_seats"] = int(totals[seats_col])
         if sections_col:
-            df[sections_col] = pd.to_numeric(df[sections_col], errors="coerce")
-            result["summary"]["total_sections"] = int(df[sections_col].sum())
+            result["summary"]["total_sections"] = int(totals[sections_col])
 
         # Calculate fill rate
         if result["summary"].get("total_enrollment") and result["summary"].get("total_seats"):
@@ -204,52 +252,30 @@ def parse_enrollment_excel(filepath: Path) -> Dict[str, Any]:
 
         # Group by Mode of Instruction
         if mode_col and enrollment_col:
-            mode_groups = df.groupby(mode_col).agg({
-                enrollment_col: "sum",
-                **(({seats_col: "sum"}) if seats_col else {}),
-                **(({sections_col: "sum"}) if sections_col else {}),
-            }).to_dict("index")
-
-            for mode, stats in mode_groups.items():
-                if pd.notna(mode):
-                    mode_str = str(mode).strip()
-                    result["by_mode"][mode_str] = {
-                        "enrollment": int(stats.get(enrollment_col, 0) or 0),
-                        "seats": int(stats.get(seats_col, 0) or 0) if seats_col else None,
-                        "sections": int(stats.get(sections_col, 0) or 0) if sections_col else None,
-                    }
+            for mode, stats in sum_by_group(df, mode_col, num_cols):
+                result["by_mode"][mode] = {
+                    "enrollment": int(stats[enrollment_col]),
+                    "seats": int(stats[seats_col]) if seats_col else None,
+                    "sections": int(stats[sections_col]) if sections_col else None,
+                }
 
         # Group by Term Length (if available)
         if term_length_col and enrollment_col:
-            length_groups = df.groupby(term_length_col).agg({
-                enrollment_col: "sum",
-                **(({seats_col: "sum"}) if seats_col else {}),
-            }).to_dict("index")
-
-            for length, stats in length_groups.items():
-                if pd.notna(length):
-                    length_str = str(length).strip()
-                    result["by_term_length"][length_str] = {
-                        "enrollment": int(stats.get(enrollment_col, 0) or 0),
-                        "seats": int(stats.get(seats_col, 0) or 0) if seats_col else None,
-                    }
+            length_cols = [c for c in (enrollment_col, seats_col) if c]
+            for length, stats in sum_by_group(df, term_length_col, length_cols):
+                result["by_term_length"][length] = {
+                    "enrollment": int(stats[enrollment_col]),
+                    "seats": int(stats[seats_col]) if seats_col else None,
+                }
 
         # Group by Discipline/Department
         if discipline_col and enrollment_col:
-            disc_groups = df.groupby(discipline_col).agg({
-                enrollment_col: "sum",
-                **(({seats_col: "sum"}) if seats_col else {}),
-                **(({sections_col: "sum"}) if sections_col else {}),
-            }).to_dict("index")
-
-            for disc, stats in disc_groups.items():
-                if pd.notna(disc):
-                    disc_str = str(disc).strip()
-                    result["by_discipline"][disc_str] = {
-                        "enrollment": int(stats.get(enrollment_col, 0) or 0),
-                        "seats": int(stats.get(seats_col, 0) or 0) if seats_col else None,
-                        "sections": int(stats.get(sections_col, 0) or 0) if sections_col else None,
-                    }
+            for disc, stats in sum_by_group(df, discipline_col, num_cols):
+                result["by_discipline"][disc] = {
+                    "enrollment": int(stats[enrollment_col]),
+                    "seats": int(stats[seats_col]) if seats_col else None,
+                    "sections": int(stats[sections_col]) if sections_col else None,
+                }
 
         # Record count
         result["raw_records_count"] = len(df)
@@ -264,9 +290,16 @@ def parse_enrollment_excel(filepath: Path) -> Dict[str, Any]:
         raise
 
 
+def _parse_one(filepath: Path) -> Tuple[str, date, Dict[str, Any]]:
+    """Parse one enrollment file into (term, snapshot date, data); runs in a worker process."""
+    term_name, snapshot_date = parse_term_from_filename(filepath.name)
+    return term_name, snapshot_date, parse_enrollment_excel(filepath)
+
+
 def load_enrollment_data(
     data_dir: Path,
     dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> List[EnrollmentSnapshot]:
     """
     Load all enrollment Excel files from a directory.
@@ -274,43 +307,45 @@ def load_enrollment_data(
     Args:
         data_dir: Directory containing enrollment Excel files
         dry_run: If True, parse but don't insert into database
+        batch_size: Number of snapshots written per transaction
 
     Returns:
         List of created EnrollmentSnapshot objects
     """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
     if not data_dir.exists():
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
 
     # Find Excel files
-    excel_files = list(data_dir.glob("*.xlsx")) + list(data_dir.glob("*.xls"))
+    excel_files = sorted(p for p in data_dir.iterdir() if p.suffix.lower() in EXCEL_SUFFIXES)
     if not excel_files:
         logger.warning(f"No Excel files found in {data_dir}")
         return []
 
     logger.info(f"Found {len(excel_files)} enrollment files in {data_dir}")
 
-    snapshots = []
+    parsed = {}
     errors = []
 
-    for filepath in sorted(excel_files):
-        try:
-            # Parse term info from filename
-            term_name, snapshot_date = parse_term_from_filename(filepath.name)
-
-            # Parse the Excel file
-            data = parse_enrollment_excel(filepath)
-
-            # Create snapshot object
-            snapshot = EnrollmentSnapshot(
-                term=term_name,
-                snapshot_date=snapshot_date,
-                data=data,
-            )
-            snapshots.append(snapshot)
-
-        except Exception as e:
-            logger.error(f"Failed to process {filepath.name}: {e}")
-            errors.append((filepath.name, str(e)))
+    # Files are independent and parsing is CPU-bound, so fan out across
+    # processes; the database write below stays serial
+    max_workers = min(len(excel_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_parse_one, fp): fp for fp in excel_files}
+        for future in as_completed(futures):
+            filepath = futures[future]
+            try:
+                parsed[filepath] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to process {filepath.name}: {e}")
+                errors.append((filepath.name, str(e)))
+
+    # Create snapshot objects in filename order
+    snapshots = [
+        EnrollmentSnapshot(term=term_name, snapshot_date=snapshot_date, data=data)
+        for term_name, snapshot_date, data in (parsed[fp] for fp in excel_files if fp in parsed)
+    ]
 
     if errors:
         logger.warning(f"Encountered {len(errors)} errors during parsing")
@@ -323,30 +358,67 @@ def load_enrollment_data(
             logger.info(f"  Would insert: {snap.term} ({snap.snapshot_date})")
         return snapshots
 
-    # Insert into database
-    with Session(engine) as session:
-        for snapshot in snapshots:
-            # Check if already exists
-            existing = session.exec(
-                select(EnrollmentSnapshot).where(
-                    EnrollmentSnapshot.term == snapshot.term,
-                    EnrollmentSnapshot.snapshot_date == snapshot.snapshot_date,
+    # Files that resolve to the same (term, snapshot date) overwrite each
+    # other, as before: the last one in filename order is what gets stored
+    latest = {}
+    for snapshot in snapshots:
+        key = (snapshot.term, snapshot.snapshot_date)
+        if key in latest:
+            logger.warning(f"Multiple files for {snapshot.term} ({snapshot.snapshot_date}); keeping the last")
+        latest[key] = snapshot
+    to_write = list(latest.values())
+
+    # Insert into database. Objects stay loaded after each commit since the
+    # batches are committed as we go and the snapshots are returned.
+    with Session(engine, expire_on_commit=False) as session:
+        # Fetch the ids of every snapshot that already exists in one query
+        keys = list(latest)
+        existing = {
+            (term, snapshot_date): snapshot_id
+            for snapshot_id, term, snapshot_date in session.exec(
+                select(
+                    EnrollmentSnapshot.id,
+                    EnrollmentSnapshot.term,
+                    EnrollmentSnapshot.snapshot_date,
+                ).where(
+                    tuple_(EnrollmentSnapshot.term, EnrollmentSnapshot.snapshot_date).in_(keys)
                 )
-            ).first()
-
-            if existing:
-                logger.info(f"Updating existing: {snapshot.term} ({snapshot.snapshot_date})")
-                existing.data = snapshot.data
-            else:
-                logger.info(f"Inserting: {snapshot.term} ({snapshot.snapshot_date})")
-                session.add(snapshot)
+            ).all()
+        }
 
-        session.commit()
+        # Commit in batches so a large run doesn't hold every JSON payload
+        # in a single transaction
+        for start in range(0, len(to_write), batch_size):
+            to_insert = []
+            to_update = []
+            for snapshot in to_write[start:start + batch_size]:
+                snapshot_id = existing.get((snapshot.term, snapshot.snapshot_date))
+                if snapshot_id:
+                    logger.info(f"Updating existing: {snapshot.term} ({snapshot.snapshot_date})")
+                    to_update.append({"id": snapshot_id, "data": snapshot.data})
+                else:
+                    logger.info(f"Inserting: {snapshot.term} ({snapshot.snapshot_date})")
+                    to_insert.append(snapshot)
+
+            session.add_all(to_insert)
+            if to_update:
+                # Bulk UPDATE by primary key, sent as a single executemany
+                session.execute(update(EnrollmentSnapshot), to_update)
+
+            session.commit()
 
     logger.info(f"Successfully loaded {len(snapshots)} enrollment snapshots")
     return snapshots
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
@@ -365,6 +437,12 @@ def main():
         action="store_true",
         help="Parse files but don't insert into database",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Snapshots to write per transaction (default: {DEFAULT_BATCH_SIZE})",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -377,7 +455,7 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
-        snapshots = load_enrollment_data(args.data_dir, args.dry_run)
+        snapshots = load_enrollment_data(args.data_dir, args.dry_run, args.batch_size)
         print(f"\n{'='*60}")
         print(f"Enrollment Data Loading Complete")
         print(f"{'='*60}")
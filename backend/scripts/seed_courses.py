@@ -5,13 +5,13 @@ Parses course data from the community college PPM Export CSV file
 and seeds the courses table in the database.
 
 Usage:
-    python scripts/seed_courses.py
+    python scripts/seed_courses.py [--batch-size N]
 
 Data source:
     reference_data/la_mission_PPM_Published_Map_Export_2025-2026_10-15-2025.csv
 """
 
-import csv
+import argparse
 import os
 import sys
 import re
@@ -23,104 +23,96 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import pandas as pd
+from sqlalchemy import insert, update
 from sqlmodel import Session, create_engine, select
 from models.course import Course, GEPattern
 from config import get_settings
+from database import bulk_load_session
 
 
 # Path to reference data (relative to project root)
 CSV_PATH = Path(__file__).parent.parent.parent.parent / "reference_data" / "la_mission_PPM_Published_Map_Export_2025-2026_10-15-2025.csv"
 
-
-def parse_course_id(course_str: str) -> Tuple[str, str]:
-    """
-    Parse course subject and number from combined string.
-
-    Examples:
-        'MATH 101' -> ('MATH', '101')
-        'ENGLISH 101X' -> ('ENGLISH', '101X')
-        'CH DEV 001' -> ('CH DEV', '001')
-        'ADM JUS 001' -> ('ADM JUS', '001')
-    """
-    if not course_str:
-        return ('', '')
-
-    # Match pattern: subject (letters/spaces) followed by number (alphanumeric)
-    # Handle multi-word subjects like "ADM JUS", "CH DEV", "POL SCI"
-    match = re.match(r'^([A-Z][A-Z\s]+?)\s+(\d+[A-Z]*)$', course_str.strip())
-    if match:
-        return (match.group(1).strip(), match.group(2))
-
-    # Fallback: split on last space
-    parts = course_str.strip().rsplit(' ', 1)
-    if len(parts) == 2:
-        return (parts[0], parts[1])
-
-    return (course_str, '')
+# Rows per INSERT/UPDATE statement. PostgreSQL throughput flattens out above
+# roughly 1k rows per batch; SQLite and MySQL keep improving up to ~10k.
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_BATCH_SIZES = {'postgresql': 1_000}
+
+# Subject (letters/spaces) followed by an alphanumeric number, e.g.
+# 'MATH 101', 'ENGLISH 101X', 'CH DEV 001', 'ADM JUS 001'
+_COURSE_ID_RE = re.compile(r'^([A-Z][A-Z\s]+?)\s+(\d+[A-Z]*)$')
+
+# Course subject code -> discipline name
+DISCIPLINE_MAP = {
+    'ACCTG': 'Accounting',
+    'ADM JUS': 'Administration of Justice',
+    'AFRO AM': 'African American Studies',
+    'ANTHRO': 'Anthropology',
+    'ART': 'Art',
+    'ARTHIST': 'Art History',
+    'BIOLOGY': 'Biological Sciences',
+    'BUS': 'Business',
+    'CHEM': 'Chemistry',
+    'CH DEV': 'Child Development',
+    'CHICANO': 'Chicano Studies',
+    'COMM': 'Communication Studies',
+    'COMPUTER': 'Computer Science & IT',
+    'CIS': 'Computer Science & IT',
+    'CS': 'Computer Science & IT',
+    'COSMET': 'Cosmetology',
+    'COUNSEL': 'Counseling',
+    'ECON': 'Economics',
+    'ENGLISH': 'English',
+    'ESL': 'English as a Second Language',
+    'FAM CS': 'Family & Consumer Studies',
+    'FRENCH': 'French',
+    'GEOG': 'Geography',
+    'GEOLOGY': 'Geology',
+    'HEALTH': 'Health Sciences',
+    'HISTORY': 'History',
+    'HUMAN': 'Humanities',
+    'JOURNAL': 'Journalism',
+    'KIN': 'Kinesiology',
+    'KINES': 'Kinesiology',
+    'LAW': 'Law',
+    'LIB SCI': 'Library Science',
+    'LING': 'Linguistics',
+    'MATH': 'Mathematics',
+    'MUSIC': 'Music',
+    'NURSING': 'Nursing',
+    'PHILOS': 'Philosophy',
+    'PHOTO': 'Photography',
+    'PHYSICS': 'Physics',
+    'POL SCI': 'Political Science',
+    'POLS': 'Political Science',
+    'PSYCH': 'Psychology',
+    'PSYC': 'Psychology',
+    'SOC': 'Sociology',
+    'SPANISH': 'Spanish',
+    'THEATER': 'Theater Arts',
+    'THTR': 'Theater Arts',
+}
+
+# Alternation of every subject code, longest first, for prefix lookups
+_DISCIPLINE_PREFIX_RE = re.compile(
+    '^(' + '|'.join(sorted(map(re.escape, DISCIPLINE_MAP), key=len, reverse=True)) + ')'
+)
 
 
 def map_discipline(subject: str) -> str:
     """
     Map course subject code to discipline name.
     """
-    discipline_map = {
-        'ACCTG': 'Accounting',
-        'ADM JUS': 'Administration of Justice',
-        'AFRO AM': 'African American Studies',
-        'ANTHRO': 'Anthropology',
-        'ART': 'Art',
-        'ARTHIST': 'Art History',
-        'BIOLOGY': 'Biological Sciences',
-        'BUS': 'Business',
-        'CHEM': 'Chemistry',
-        'CH DEV': 'Child Development',
-        'CHICANO': 'Chicano Studies',
-        'COMM': 'Communication Studies',
-        'COMPUTER': 'Computer Science & IT',
-        'CIS': 'Computer Science & IT',
-        'CS': 'Computer Science & IT',
-        'COSMET': 'Cosmetology',
-        'COUNSEL': 'Counseling',
-        'ECON': 'Economics',
-        'ENGLISH': 'English',
-        'ESL': 'English as a Second Language',
-        'FAM CS': 'Family & Consumer Studies',
-        'FRENCH': 'French',
-        'GEOG': 'Geography',
-        'GEOLOGY': 'Geology',
-        'HEALTH': 'Health Sciences',
-        'HISTORY': 'History',
-        'HUMAN': 'Humanities',
-        'JOURNAL': 'Journalism',
-        'KIN': 'Kinesiology',
-        'KINES': 'Kinesiology',
-        'LAW': 'Law',
-        'LIB SCI': 'Library Science',
-        'LING': 'Linguistics',
-        'MATH': 'Mathematics',
-        'MUSIC': 'Music',
-        'NURSING': 'Nursing',
-        'PHILOS': 'Philosophy',
-        'PHOTO': 'Photography',
-        'PHYSICS': 'Physics',
-        'POL SCI': 'Political Science',
-        'POLS': 'Political Science',
-        'PSYCH': 'Psychology',
-        'PSYC': 'Psychology',
-        'SOC': 'Sociology',
-        'SPANISH': 'Spanish',
-        'THEATER': 'Theater Arts',
-        'THTR': 'Theater Arts',
-    }
-
     # Try exact match first
-    if subject in discipline_map:
-        return discipline_map[subject]
+    discipline = DISCIPLINE_MAP.get(subject)
+    if discipline:
+        return discipline
 
-    # Try prefix match
-    for prefix, discipline in discipline_map.items():
-        if subject.startswith(prefix):
-            return discipline
+    # Try prefix match (longest prefix wins)
+    match = _DISCIPLINE_PREFIX_RE.match(subject)
+    if match:
+        return DISCIPLINE_MAP[match.group(1)]
 
     # Default: capitalize subject
     return subject.title()
@@ -151,125 +143,170 @@ def load_courses_from_csv(filepath: Path) -> Dict[str, Dict]:
     """
     Load and deduplicate courses from CSV file.
 
+    The file is read in one pass with pandas and parsed column-wise; the
+    first row for each course wins, taking its GE area from the first row
+    that has one.
+
     Returns:
         Dict mapping course_id -> course data dict
     """
-    courses: Dict[str, Dict] = {}
-
     print(f"Loading courses from: {filepath}")
 
     if not filepath.exists():
         print(f"ERROR: File not found: {filepath}")
-        return courses
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            course_str = row.get('Course Subject and Number', '').strip()
-            if not course_str:
-                continue
-
-            # Parse subject and number
-            subject, number = parse_course_id(course_str)
-            if not subject or not number:
-                continue
-
-            course_id = f"{subject} {number}"
-
-            # Skip if already processed (deduplicate)
-            if course_id in courses:
-                # Update GE info if this row has it
-                ge_area = row.get('Gen Ed Pattern Sub Area', '').strip()
-                if ge_area and not courses[course_id].get('ge_area'):
-                    courses[course_id]['ge_area'] = ge_area
-                    courses[course_id]['ge_pattern'] = map_ge_pattern(ge_area)
-                    courses[course_id]['is_ge_approved'] = True
-                continue
-
-            # Extract course data
-            title = row.get('Course Name', '').strip()
-            min_units = float(row.get('Course Min Units', 0) or 0)
-            max_units = float(row.get('Course Max Units', 0) or 0)
-            ge_area = row.get('Gen Ed Pattern Sub Area', '').strip()
-
-            courses[course_id] = {
-                'subject': subject,
-                'number': number,
-                'course_id': course_id,
-                'title': title,
-                'discipline': map_discipline(subject),
-                'min_units': min_units,
-                'max_units': max_units,
-                'ge_pattern': map_ge_pattern(ge_area),
-                'ge_area': ge_area if ge_area else None,
-                'is_ge_approved': bool(ge_area),
-                'is_active': True,
-            }
+        return {}
+
+    df = pd.read_csv(
+        filepath,
+        usecols=[
+            'Course Subject and Number',
+            'Course Name',
+            'Course Min Units',
+            'Course Max Units',
+            'Gen Ed Pattern Sub Area',
+        ],
+        dtype='string',
+        keep_default_na=False,
+        encoding='utf-8',
+    )
+
+    # Parse subject and number, falling back to a split on the last space
+    # for ids the pattern doesn't match
+    course_str = df['Course Subject and Number'].str.strip()
+    parts = course_str.str.extract(_COURSE_ID_RE)
+    unmatched = course_str[parts[1].isna()]
+    fallback = unmatched.str.rsplit(' ', n=1, expand=True).reindex(columns=[0, 1])
+    df['subject'] = parts[0].str.strip().fillna(fallback[0])
+    df['number'] = parts[1].fillna(fallback[1])
+    df = df[(df['subject'].fillna('') != '') & (df['number'].fillna('') != '')]
+    df['course_id'] = df['subject'] + ' ' + df['number']
+
+    # First non-empty GE area per course, then deduplicate
+    ge_area = df['Gen Ed Pattern Sub Area'].str.strip()
+    first_ge_area = ge_area[ge_area != ''].groupby(df['course_id'], sort=False).first()
+    df = df.drop_duplicates('course_id', keep='first')
+    ge_area = df['course_id'].map(first_ge_area).astype(object)
+    ge_area = ge_area.where(ge_area.notna(), None)
+
+    # Map each distinct subject / GE area once rather than once per row
+    subjects = df['subject']
+    courses_df = pd.DataFrame({
+        'subject': subjects,
+        'number': df['number'],
+        'course_id': df['course_id'],
+        'title': df['Course Name'].str.strip(),
+        'discipline': subjects.map({s: map_discipline(s) for s in subjects.unique()}),
+        'min_units': pd.to_numeric(df['Course Min Units'].replace('', '0')).astype(float),
+        'max_units': pd.to_numeric(df['Course Max Units'].replace('', '0')).astype(float),
+        'ge_pattern': ge_area.map({g: map_ge_pattern(g) for g in ge_area.unique()}),
+        'ge_area': ge_area,
+        'is_ge_approved': ge_area.notna(),
+        'is_active': True,
+    })
+    courses = {row['course_id']: row for row in courses_df.to_dict('records')}
 
     print(f"Loaded {len(courses)} unique courses from CSV")
     return courses
 
 
-def seed_courses(engine) -> int:
+def default_batch_size(engine) -> int:
+    """Rows per INSERT/UPDATE batch for the engine's database."""
+    return DEFAULT_BATCH_SIZES.get(engine.dialect.name, DEFAULT_BATCH_SIZE)
+
+
+def seed_courses(engine, batch_size: Optional[int] = None) -> int:
     """
     Seed courses into the database.
 
+    Args:
+        engine: Database engine to seed
+        batch_size: Rows per INSERT/UPDATE statement (default: per dialect)
+
     Returns:
         Number of courses created
     """
+    if batch_size is None:
+        batch_size = default_batch_size(engine)
+    elif batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
     courses_data = load_courses_from_csv(CSV_PATH)
 
     if not courses_data:
         print("No courses to seed")
         return 0
 
-    created_count = 0
-    updated_count = 0
+    # One timestamp for the whole seed
+    now = datetime.utcnow()
 
-    with Session(engine) as session:
+    with bulk_load_session(engine) as session:
+        # Fetch every course already seeded in one query
+        existing = {
+            course_id: (pk, ge_area)
+            for course_id, pk, ge_area in session.exec(
+                select(Course.course_id, Course.id, Course.ge_area)
+            ).all()
+        }
+
+        new_rows = []
+        update_rows = []
         for course_id, data in courses_data.items():
-            # Check if course already exists
-            existing = session.exec(
-                select(Course).where(Course.course_id == course_id)
-            ).first()
-
-            if existing:
-                # Update existing course
-                for key, value in data.items():
-                    if hasattr(existing, key) and value is not None:
-                        setattr(existing, key, value)
-                existing.updated_at = datetime.utcnow()
-                updated_count += 1
+            if course_id in existing:
+                # Update existing course, keeping the stored GE area if the CSV has none.
+                # Every row carries the same keys so the UPDATE runs as one batch.
+                pk, stored_ge_area = existing[course_id]
+                update_rows.append({
+                    **data,
+                    'id': pk,
+                    'ge_area': data['ge_area'] or stored_ge_area,
+                    'updated_at': now,
+                })
             else:
                 # Create new course
-                course = Course(
-                    id=uuid4(),
-                    subject=data['subject'],
-                    number=data['number'],
-                    course_id=data['course_id'],
-                    title=data['title'],
-                    discipline=data['discipline'],
-                    min_units=data['min_units'],
-                    max_units=data['max_units'],
-                    ge_pattern=data['ge_pattern'],
-                    ge_area=data['ge_area'],
-                    is_ge_approved=data['is_ge_approved'],
-                    is_active=data['is_active'],
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                session.add(course)
-                created_count += 1
+                new_rows.append({
+                    **data,
+                    'id': uuid4(),
+                    'created_at': now,
+                    'updated_at': now,
+                })
+
+        # Multi-row INSERTs (insertmanyvalues) and bulk UPDATEs by primary key,
+        # batch_size rows at a time. render_nulls keeps None values in the
+        # parameter sets so rows aren't split into separate batches by which
+        # columns happen to be NULL. The seed still commits once.
+        insert_stmt = insert(Course).execution_options(render_nulls=True)
+        for start in range(0, len(new_rows), batch_size):
+            session.execute(insert_stmt, new_rows[start:start + batch_size])
+        for start in range(0, len(update_rows), batch_size):
+            session.execute(update(Course), update_rows[start:start + batch_size])
 
         session.commit()
 
+    created_count = len(new_rows)
+    updated_count = len(update_rows)
+
     print(f"Courses seeded: {created_count} created, {updated_count} updated")
     return created_count
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Seed the courses table from the PPM export CSV")
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=None,
+        help=f"Rows per INSERT/UPDATE statement (default: 1000 on PostgreSQL, {DEFAULT_BATCH_SIZE} otherwise)",
+    )
+    args = parser.parse_args()
+
     settings = get_settings()
 
     print("=" * 60)
@@ -282,7 +319,7 @@ def main():
     engine = create_engine(settings.database_url)
 
     # Seed courses
-    count = seed_courses(engine)
+    count = seed_courses(engine, args.batch_size)
 
     print()
     print(f"Done! Total courses in database: {count}")
@@ -4,24 +4,61 @@ SLO Data Seed Script
 Seeds sample CSLO and PSLO assessment data for demonstration and testing.
 
 Usage:
-    python scripts/seed_slo.py
+    python scripts/seed_slo.py [--parallel] [--dump | --from-dump] [--dump-file PATH]
+
+--dump writes the seeded SLO tables to a data-only SQL dump after seeding;
+--from-dump loads that dump instead of regenerating the data. --parallel
+seeds CSLO and PSLO concurrently in separate transactions (PostgreSQL).
+
+Set SEED_BATCH_SIZE to override the number of rows written per INSERT batch.
+Rows are committed once, at the end of the run (of each phase with --parallel).
 """
 
-import sys
+import argparse
+import os
 import random
+import re
+import sqlite3
+import subprocess
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from datetime import datetime
-from uuid import uuid4
-from typing import List, Optional
+from uuid import UUID
+from typing import Callable, List, Optional
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
+from sqlalchemy import URL, insert, make_url
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, create_engine, select
 from models.course import Course, SLOAssessment, PSLOAssessment
 from models.organization import Organization, OrganizationType
 from config import get_settings
+from database import bulk_load_session
+
 
+# Data-only dump of the seeded tables, for --dump / --from-dump
+DUMP_PATH = Path(__file__).parent / "seed_slo.sql"
+SEED_TABLES = (SLOAssessment.__tablename__, PSLOAssessment.__tablename__)
+
+# Sample sizes for the demo data, and rows fetched per round trip while
+# streaming them
+COURSE_LIMIT = 50
+DEPARTMENT_LIMIT = 20
+STREAM_BATCH_SIZE = 200
+
+# Dialect INSERT constructs that support ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# PostgreSQL allows at most 32767 bind parameters per statement
+MAX_BIND_PARAMS = 32767
 
 # Sample SLO descriptions by discipline
 CSLO_TEMPLATES = {
@@ -79,175 +116,363 @@ PSLO_TEMPLATES = {
     ],
 }
 
+# First three CSLO descriptions per discipline, the most seeded per course
+_CSLO_TOP3 = {discipline: tuple(descriptions[:3]) for discipline, descriptions in CSLO_TEMPLATES.items()}
+_CSLO_TOP3_DEFAULT = _CSLO_TOP3["default"]
 
-def get_cslo_descriptions(discipline: str) -> List[str]:
-    """Get CSLO descriptions for a discipline."""
-    return CSLO_TEMPLATES.get(discipline, CSLO_TEMPLATES["default"])
+# Department-name keyword -> template discipline
+DISCIPLINE_KEYWORDS = {
+    "math": "Mathematics",
+    "english": "English",
+    "psych": "Psychology",
+    "bio": "Biology",
+}
+_DISCIPLINE_KEYWORD_RE = re.compile("|".join(DISCIPLINE_KEYWORDS))
 
 
+@lru_cache(maxsize=32)
 def get_pslo_descriptions(discipline: str) -> List[str]:
     """Get PSLO descriptions for a discipline."""
     return PSLO_TEMPLATES.get(discipline, PSLO_TEMPLATES["default"])
 
 
-def generate_assessment_data(target: float = 70.0) -> dict:
-    """Generate realistic assessment data."""
+def generate_assessment_batch(n: int, target: float = 70.0) -> dict:
+    """
+    Generate realistic assessment data for n assessments in one vectorized pass.
+
+    Returns a dict of length-n lists keyed by assessment column.
+    """
+    rng = np.random.default_rng()
+
     # Generate realistic numbers
-    students_assessed = random.randint(50, 300)
+    students_assessed = rng.integers(50, 301, n)
 
     # Achievement percentage varies around the target
     # Some above, some below
-    achievement = target + random.uniform(-15, 20)
-    achievement = max(40, min(95, achievement))  # Clamp between 40-95%
+    achievement = np.clip(target + rng.uniform(-15, 20, n), 40, 95)  # Clamp between 40-95%
 
-    students_meeting = int(students_assessed * (achievement / 100))
+    students_meeting = (students_assessed * (achievement / 100)).astype(int)
     meets_target = achievement >= target
 
     return {
-        "students_assessed": students_assessed,
-        "students_meeting_criteria": students_meeting,
-        "achievement_percentage": round(achievement, 1),
-        "target_percentage": target,
-        "meets_target": meets_target,
+        "students_assessed": students_assessed.tolist(),
+        "students_meeting_criteria": students_meeting.tolist(),
+        "achievement_percentage": np.round(achievement, 1).tolist(),
+        "target_percentage": [target] * n,
+        "meets_target": meets_target.tolist(),
     }
 
 
-def seed_cslo_assessments(session: Session) -> int:
-    """Seed CSLO assessments for existing courses."""
-    # Get sample courses (limit for demo)
-    courses = session.exec(
-        select(Course).where(Course.is_active == True).limit(50)
-    ).all()
+def bulk_uuids(n: int) -> List[UUID]:
+    """Generate n random (version 4) UUIDs from a single os.urandom call."""
+    buf = os.urandom(16 * n)
+    return [UUID(bytes=buf[i:i + 16], version=4) for i in range(0, 16 * n, 16)]
 
-    if not courses:
-        print("No courses found. Run seed_courses.py first.")
+
+def bulk_insert(session: Session, model, rows: List[dict]) -> int:
+    """
+    Insert plain dict rows with multi-row INSERTs, bypassing the ORM unit of
+    work; returns the number of rows actually inserted.
+
+    Rows are chunked so each statement stays under PostgreSQL's bind
+    parameter limit. Ids are generated client-side (bulk_uuids), so there is
+    no per-object refresh.
+
+    On PostgreSQL and SQLite, rows that collide with an existing assessment
+    (the models' unique term keys) are skipped by the database via
+    ON CONFLICT DO NOTHING. Only the ids of written rows come back through
+    RETURNING, so skipped rows aren't counted (the DBAPI rowcount can't be
+    trusted for batched executemany).
+    """
+    if not rows:
         return 0
+    chunk_size = max(1, MAX_BIND_PARAMS // len(rows[0]))
+    dialect_insert = _CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(model).on_conflict_do_nothing().returning(model.id)
+    else:
+        stmt = insert(model)
+    # render_nulls keeps None values (e.g. mapped_courses) in the parameter
+    # sets so rows aren't split into separate batches by which are NULL
+    stmt = stmt.execution_options(render_nulls=True)
+    inserted = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        result = session.execute(stmt, chunk)
+        inserted += len(result.all()) if dialect_insert is not None else len(chunk)
+    return inserted
+
+
+def seed_batch_size(session: Session) -> int:
+    """
+    Rows per INSERT batch: SEED_BATCH_SIZE if set, otherwise 1000 on
+    PostgreSQL (where batch gains plateau) and 10000 elsewhere.
+    """
+    if os.getenv("SEED_BATCH_SIZE"):
+        return int(os.getenv("SEED_BATCH_SIZE"))
+    return 1000 if session.get_bind().dialect.name == "postgresql" else 10_000
+
+
+def write_batches(session: Session, model, rows: List[dict], batch_size: int) -> int:
+    """
+    Insert rows batch_size at a time; returns the number of rows inserted.
+
+    Nothing is committed here: the caller owns the transaction, so the
+    session setup from bulk_load_session (e.g. SET LOCAL synchronous_commit
+    on PostgreSQL) covers every batch.
+    """
+    inserted = 0
+    for start in range(0, len(rows), batch_size):
+        inserted += bulk_insert(session, model, rows[start:start + batch_size])
+    return inserted
 
-    terms = ["Fall 2023", "Spring 2024", "Fall 2024"]
-    created_count = 0
 
-    for course in courses:
+def seed_cslo_assessments(session: Session) -> int:
+    """Seed CSLO assessments for existing courses; the caller commits."""
+    # Sample courses (limit for demo), streamed rather than loaded up front
+    sample_courses = select(Course.id, Course.discipline).where(Course.is_active == True).limit(COURSE_LIMIT)
+
+    terms = ["Fall 2023", "Spring 2024", "Fall 2024"]
+    now = datetime.utcnow()
+    rows = []
+    course_count = 0
+
+    # Courses that already have assessments, fetched in one query
+    assessed_course_ids = set(session.exec(
+        select(SLOAssessment.course_id).distinct()
+        .where(SLOAssessment.course_id.in_(sample_courses.with_only_columns(Course.id)))
+    ).all())
+
+    for (course_pk, discipline), term in zip(
+        session.exec(sample_courses.execution_options(yield_per=STREAM_BATCH_SIZE)),
+        random.choices(terms, k=COURSE_LIMIT),
+    ):
+        course_count += 1
         # Skip if course already has assessments
-        existing = session.exec(
-            select(SLOAssessment).where(SLOAssessment.course_id == course.id)
-        ).first()
-        if existing:
+        if course_pk in assessed_course_ids:
             continue
 
-        # Get SLO descriptions for this discipline
-        slo_descriptions = get_cslo_descriptions(course.discipline)
+        # Get SLO descriptions for this discipline (max 3 SLOs)
+        slo_descriptions = _CSLO_TOP3.get(discipline, _CSLO_TOP3_DEFAULT)
 
         # Create assessments for the most recent term
-        term = random.choice(terms)
         academic_year = "2023-2024" if "2023" in term or (term == "Spring 2024") else "2024-2025"
 
-        for i, description in enumerate(slo_descriptions[:3], 1):  # Max 3 SLOs
-            data = generate_assessment_data()
-
-            assessment = SLOAssessment(
-                id=uuid4(),
-                course_id=course.id,
-                term=term,
-                academic_year=academic_year,
-                slo_number=i,
-                slo_description=description,
-                students_assessed=data["students_assessed"],
-                students_meeting_criteria=data["students_meeting_criteria"],
-                achievement_percentage=data["achievement_percentage"],
-                target_percentage=data["target_percentage"],
-                meets_target=data["meets_target"],
-                action_taken="Continue current teaching strategies" if data["meets_target"] else "Implement additional support interventions",
-                created_at=datetime.utcnow(),
-            )
-            session.add(assessment)
-            created_count += 1
-
-    session.commit()
-    return created_count
+        for i, description in enumerate(slo_descriptions, 1):
+            rows.append({
+                "course_id": course_pk,
+                "term": term,
+                "academic_year": academic_year,
+                "slo_number": i,
+                "slo_description": description,
+                "created_at": now,
+            })
+
+    if not course_count:
+        print("No courses found. Run seed_courses.py first.")
+        return 0
 
+    # Generate ids and assessment results for every row at once
+    data = generate_assessment_batch(len(rows))
+    for row, row_id, *values in zip(rows, bulk_uuids(len(rows)), *data.values()):
+        row["id"] = row_id
+        row.update(zip(data, values))
+        row["action_taken"] = "Continue current teaching strategies" if row["meets_target"] else "Implement additional support interventions"
 
-def seed_pslo_assessments(session: Session) -> int:
-    """Seed PSLO assessments for programs."""
-    # Get departments (programs)
-    departments = session.exec(
-        select(Organization).where(Organization.type == OrganizationType.DEPARTMENT)
-    ).all()
+    return write_batches(session, SLOAssessment, rows, seed_batch_size(session))
 
-    if not departments:
-        print("No departments found. Run seed.py first to create organizations.")
-        return 0
+
+def seed_pslo_assessments(session: Session) -> int:
+    """Seed PSLO assessments for programs; the caller commits."""
+    # Departments (programs), limited for demo and streamed
+    sample_departments = (
+        select(Organization.id, Organization.name)
+        .where(Organization.type == OrganizationType.DEPARTMENT)
+        .limit(DEPARTMENT_LIMIT)
+    )
 
     # Sample program data
     award_types = ["AA-T", "AS-T", "AA", "AS", "Certificate"]
     terms = ["Fall 2023", "Spring 2024", "Fall 2024"]
-    created_count = 0
+    now = datetime.utcnow()
+    rows = []
+    department_count = 0
+
+    # Programs that already have assessments, fetched in one query
+    assessed_program_ids = set(session.exec(
+        select(PSLOAssessment.program_id).distinct()
+        .where(PSLOAssessment.program_id.in_(sample_departments.with_only_columns(Organization.id)))
+    ).all())
+
+    # Course ids per discipline for PSLO course mapping, in one query
+    courses_by_discipline = defaultdict(list)
+    for discipline, course_id in session.exec(
+        select(Course.discipline, Course.course_id)
+        .where(Course.discipline.in_(sample_departments.with_only_columns(Organization.name)))
+    ).all():
+        courses_by_discipline[discipline].append(course_id)
+
+    chosen_awards = random.choices(award_types, k=DEPARTMENT_LIMIT)
+    chosen_terms = random.choices(terms, k=DEPARTMENT_LIMIT)
+
+    for (dept_id, dept_name), award, term in zip(
+        session.exec(sample_departments.execution_options(yield_per=STREAM_BATCH_SIZE)),
+        chosen_awards,
+        chosen_terms,
+    ):
+        department_count += 1
 
-    for dept in departments[:20]:  # Limit for demo
         # Skip if already has assessments
-        existing = session.exec(
-            select(PSLOAssessment).where(PSLOAssessment.program_id == dept.id)
-        ).first()
-        if existing:
+        if dept_id in assessed_program_ids:
             continue
 
         # Determine discipline from department name
-        discipline = "default"
-        dept_lower = dept.name.lower()
-        if "math" in dept_lower:
-            discipline = "Mathematics"
-        elif "english" in dept_lower:
-            discipline = "English"
-        elif "psych" in dept_lower:
-            discipline = "Psychology"
-        elif "bio" in dept_lower:
-            discipline = "Biology"
+        match = _DISCIPLINE_KEYWORD_RE.search(dept_name.lower())
+        discipline = DISCIPLINE_KEYWORDS[match.group(0)] if match else "default"
 
         pslo_descriptions = get_pslo_descriptions(discipline)
 
         # Create program name
-        award = random.choice(award_types)
-        program_name = f"{dept.name} {award}"
+        program_name = f"{dept_name} {award}"
 
         # Create assessments
-        term = random.choice(terms)
         academic_year = "2023-2024" if "2023" in term or (term == "Spring 2024") else "2024-2025"
 
-        # Get courses in this discipline for mapping
-        courses = session.exec(
-            select(Course).where(Course.discipline == dept.name).limit(5)
-        ).all()
-        mapped_course_ids = ",".join([c.course_id for c in courses]) if courses else None
+        # Courses in this discipline for mapping
+        discipline_courses = courses_by_discipline.get(dept_name, [])[:5]
+        mapped_course_ids = ",".join(discipline_courses) if discipline_courses else None
 
         for i, description in enumerate(pslo_descriptions, 1):
-            data = generate_assessment_data()
-
-            assessment = PSLOAssessment(
-                id=uuid4(),
-                program_id=dept.id,
-                program_name=program_name,
-                award_type=award,
-                term=term,
-                academic_year=academic_year,
-                pslo_number=i,
-                pslo_description=description,
-                students_assessed=data["students_assessed"],
-                students_meeting_criteria=data["students_meeting_criteria"],
-                achievement_percentage=data["achievement_percentage"],
-                target_percentage=data["target_percentage"],
-                meets_target=data["meets_target"],
-                mapped_courses=mapped_course_ids,
-                action_taken="Program outcomes are being met effectively" if data["meets_target"] else "Review curriculum mapping and assessment methods",
-                created_at=datetime.utcnow(),
-            )
-            session.add(assessment)
-            created_count += 1
-
-    session.commit()
-    return created_count
+            rows.append({
+                "program_id": dept_id,
+                "program_name": program_name,
+                "award_type": award,
+                "term": term,
+                "academic_year": academic_year,
+                "pslo_number": i,
+                "pslo_description": description,
+                "mapped_courses": mapped_course_ids,
+                "created_at": now,
+            })
+
+    if not department_count:
+        print("No departments found. Run seed.py first to create organizations.")
+        return 0
+
+    # Generate ids and assessment results for every row at once
+    data = generate_assessment_batch(len(rows))
+    for row, row_id, *values in zip(rows, bulk_uuids(len(rows)), *data.values()):
+        row["id"] = row_id
+        row.update(zip(data, values))
+        row["action_taken"] = "Program outcomes are being met effectively" if row["meets_target"] else "Review curriculum mapping and assessment methods"
+
+    return write_batches(session, PSLOAssessment, rows, seed_batch_size(session))
+
+
+def seed_session(engine):
+    """
+    Open a bulk-load session for seeding (see database.bulk_load_session);
+    the caller commits.
+
+    Rows go through bulk INSERTs, so there's nothing pending to autoflush
+    before the prefetch queries, and loaded objects stay usable after commit.
+    """
+    return bulk_load_session(engine, autoflush=False, expire_on_commit=False)
+
+
+def run_seed_phase(engine, seed_phase: Callable[..., int]) -> int:
+    """Run one seed function in its own session and transaction; returns its row count."""
+    with seed_session(engine) as session:
+        count = seed_phase(session)
+        session.commit()
+    return count
+
+
+def _libpq_url(url: URL) -> str:
+    """
+    Render a SQLAlchemy PostgreSQL URL as a plain libpq connection URI for
+    psql/pg_dump, without the password (command lines are visible in ps).
+    """
+    return URL.create(
+        drivername="postgresql",
+        username=url.username,
+        host=url.host,
+        port=url.port,
+        database=url.database,
+        query=url.query,
+    ).render_as_string()
+
+
+def _libpq_env(url: URL) -> dict:
+    """Environment for psql/pg_dump, passing the URL's password as PGPASSWORD."""
+    env = dict(os.environ)
+    if url.password:
+        env["PGPASSWORD"] = url.password
+    return env
+
+
+def dump_seed_data(database_url: str, dump_path: Path) -> None:
+    """Write a data-only SQL dump of the SLO assessment tables."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql":
+        table_args = [arg for table in SEED_TABLES for arg in ("-t", table)]
+        subprocess.run(
+            ["pg_dump", _libpq_url(url), "--data-only", *table_args, "-f", str(dump_path)],
+            env=_libpq_env(url),
+            check=True,
+        )
+    elif url.get_backend_name() == "sqlite":
+        prefixes = tuple(f'INSERT INTO "{table}"' for table in SEED_TABLES)
+        with closing(sqlite3.connect(url.database)) as conn:
+            inserts = [line for line in conn.iterdump() if line.startswith(prefixes)]
+        dump_path.write_text("BEGIN TRANSACTION;\n" + "\n".join(inserts) + "\nCOMMIT;\n")
+    else:
+        raise ValueError(f"Seed dumps are not supported for {url.get_backend_name()}")
+
+
+def restore_seed_data(database_url: str, dump_path: Path) -> None:
+    """Load a dump written by dump_seed_data() into the database."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql":
+        subprocess.run(
+            ["psql", _libpq_url(url), "-v", "ON_ERROR_STOP=1", "-q", "-f", str(dump_path)],
+            env=_libpq_env(url),
+            check=True,
+        )
+    elif url.get_backend_name() == "sqlite":
+        with closing(sqlite3.connect(url.database)) as conn:
+            conn.executescript(dump_path.read_text())
+    else:
+        raise ValueError(f"Seed dumps are not supported for {url.get_backend_name()}")
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Seed sample CSLO and PSLO assessment data")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--from-dump",
+        action="store_true",
+        help="Load a previously written dump instead of generating data",
+    )
+    mode.add_argument(
+        "--dump",
+        action="store_true",
+        help="After seeding, write the SLO tables to the dump file",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Seed CSLO and PSLO concurrently, each in its own transaction (not on SQLite)",
+    )
+    parser.add_argument(
+        "--dump-file",
+        type=Path,
+        default=DUMP_PATH,
+        help=f"SQL dump location (default: {DUMP_PATH})",
+    )
+    args = parser.parse_args()
+
     settings = get_settings()
 
     print("=" * 60)
@@ -256,19 +481,48 @@ def main():
     print(f"Database: {settings.database_url[:50]}...")
     print()
 
+    if args.from_dump:
+        print(f"Restoring SLO data from {args.dump_file}...")
+        restore_seed_data(settings.database_url, args.dump_file)
+        print("Done!")
+        return
+
     # Create engine
     engine = create_engine(settings.database_url)
 
-    with Session(engine) as session:
-        # Seed CSLO assessments
-        print("Seeding CSLO assessments...")
-        cslo_count = seed_cslo_assessments(session)
+    if args.parallel and engine.dialect.name == "sqlite":
+        print("SQLite allows a single writer; seeding sequentially instead of in parallel")
+        args.parallel = False
+
+    if args.parallel:
+        # The phases touch different tables, so run them on two pooled
+        # connections and let one's database I/O overlap the other's work
+        print("Seeding CSLO and PSLO assessments in parallel...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cslo_future = executor.submit(run_seed_phase, engine, seed_cslo_assessments)
+            pslo_future = executor.submit(run_seed_phase, engine, seed_pslo_assessments)
+            cslo_count = cslo_future.result()
+            pslo_count = pslo_future.result()
         print(f"  Created {cslo_count} CSLO assessment records")
-
-        # Seed PSLO assessments
-        print("Seeding PSLO assessments...")
-        pslo_count = seed_pslo_assessments(session)
         print(f"  Created {pslo_count} PSLO assessment records")
+    else:
+        with seed_session(engine) as session:
+            # Both phases share one transaction, committed once at the end
+            # Seed CSLO assessments
+            print("Seeding CSLO assessments...")
+            cslo_count = seed_cslo_assessments(session)
+            print(f"  Created {cslo_count} CSLO assessment records")
+
+            # Seed PSLO assessments
+            print("Seeding PSLO assessments...")
+            pslo_count = seed_pslo_assessments(session)
+            print(f"  Created {pslo_count} PSLO assessment records")
+
+            session.commit()
+
+    if args.dump:
+        dump_seed_data(settings.database_url, args.dump_file)
+        print(f"Wrote SLO data dump to {args.dump_file}")
 
     print()
     print(f"Done! Total SLO records: {cslo_count + pslo_count}")
@@ -0,0 +1,82 @@
+"""
+Shared fixtures for backend tests.
+
+Each test gets its own in-memory SQLite database; the app's get_session and
+get_current_user dependencies are overridden to use it.
+"""
+
+import os
+
+# Keep imports of database/config away from the developer's database file,
+# and authenticate in development mode (the token is the user's identifier)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ["FIREBASE_ENABLED"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from database import get_session
+from main import app
+from models.organization import Organization, OrganizationType
+from models.user import User, UserRole
+from routers import reviews
+from routers.auth import get_current_user
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def department(session):
+    department = Organization(name="Mathematics", type=OrganizationType.DEPARTMENT)
+    session.add(department)
+    session.commit()
+    return department
+
+
+@pytest.fixture
+def admin_user(session):
+    user = User(
+        firebase_uid="test-admin",
+        email="admin@test.edu",
+        full_name="Test Admin",
+        role=UserRole.ADMIN,
+    )
+    session.add(user)
+    session.commit()
+    return user
+
+
+@pytest.fixture
+def client(engine, admin_user):
+    """Test client authenticated as admin_user; set client.user to switch users."""
+
+    def override_get_session():
+        with Session(engine, expire_on_commit=False) as session:
+            yield session
+
+    client = TestClient(app)
+    client.user = admin_user
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_current_user] = lambda: client.user
+    reviews._review_list_cache.clear()
+    yield client
+    app.dependency_overrides.clear()
+    reviews._review_list_cache.clear()
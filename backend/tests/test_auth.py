@@ -0,0 +1,43 @@
+"""
+Tests for the cross-request user cache in get_current_user.
+"""
+
+import pytest
+from sqlmodel import Session
+
+from main import app
+from models.user import User
+from routers import auth
+from routers.auth import get_current_user
+
+
+@pytest.fixture
+def auth_client(client):
+    """Client that authenticates through get_current_user in development mode."""
+    app.dependency_overrides.pop(get_current_user)
+    auth._user_cache.clear()
+    yield client
+    auth._user_cache.clear()
+
+
+def test_resolved_user_is_cached_until_logout(auth_client, engine, admin_user):
+    headers = {"Authorization": "Bearer test-admin"}
+    assert auth_client.get("/api/reviews", headers=headers).status_code == 200
+    assert "test-admin" in auth._user_cache
+
+    # Served from the cache without looking the user up again
+    with Session(engine) as session:
+        session.delete(session.get(User, admin_user.id))
+        session.commit()
+    assert auth_client.get("/api/reviews", headers=headers).status_code == 200
+
+    assert auth_client.post("/api/auth/logout", headers=headers).status_code == 204
+    assert "test-admin" not in auth._user_cache
+    assert auth_client.get("/api/reviews", headers=headers).status_code == 401
+
+
+def test_unknown_token_is_not_cached(auth_client):
+    response = auth_client.get("/api/reviews", headers={"Authorization": "Bearer nobody"})
+
+    assert response.status_code == 401
+    assert "nobody" not in auth._user_cache
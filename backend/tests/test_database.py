@@ -0,0 +1,51 @@
+"""
+Tests for database.bulk_load_session.
+"""
+
+import pytest
+from sqlmodel import create_engine
+
+from database import bulk_load_session
+
+PRAGMAS = ("synchronous", "journal_mode", "temp_store")
+
+
+def read_pragmas(engine):
+    with engine.connect() as connection:
+        return {pragma: connection.exec_driver_sql(f"PRAGMA {pragma}").scalar() for pragma in PRAGMAS}
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_bulk_load_pragmas_are_scoped_and_restored(file_engine):
+    before = read_pragmas(file_engine)
+
+    with bulk_load_session(file_engine) as session:
+        during = {
+            pragma: session.connection().exec_driver_sql(f"PRAGMA {pragma}").scalar()
+            for pragma in PRAGMAS
+        }
+        session.connection().exec_driver_sql("CREATE TABLE t (x INTEGER)")
+        session.connection().exec_driver_sql("INSERT INTO t VALUES (1)")
+        session.commit()
+
+    assert during == {"synchronous": 0, "journal_mode": "memory", "temp_store": 2}
+    assert read_pragmas(file_engine) == before
+    with file_engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT x FROM t").scalar() == 1
+
+
+def test_bulk_load_pragmas_are_restored_after_a_failed_load(file_engine):
+    before = read_pragmas(file_engine)
+
+    with pytest.raises(RuntimeError):
+        with bulk_load_session(file_engine) as session:
+            session.connection().exec_driver_sql("CREATE TABLE t (x INTEGER)")
+            raise RuntimeError("load failed")
+
+    assert read_pragmas(file_engine) == before
@@ -0,0 +1,120 @@
+"""
+Tests for enrollment workbook parsing.
+"""
+
+import argparse
+
+import pytest
+from openpyxl import Workbook
+
+from sqlmodel import Session, select
+
+from models.enrollment import EnrollmentSnapshot
+from scripts import load_enrollment
+from scripts.load_enrollment import load_enrollment_data, parse_enrollment_excel, positive_int
+
+
+def write_workbook(path, header, rows):
+    """Write a single-sheet workbook with header and rows to path."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+def test_column_may_fill_several_fields(tmp_path):
+    # 'Enrl Cap' matches both enrollment ("enrl") and seats ("cap"); as in the
+    # original per-key scan, each field takes the first column that matches it
+    path = write_workbook(
+        tmp_path / "Fall_2024 (11-13-24).xlsx",
+        ["Subject", "Enrl Cap", "Seats", "Sections"],
+        [["MATH", 30, 40, 1], ["ENGL", 20, 25, 1]],
+    )
+
+    data = parse_enrollment_excel(path)
+
+    assert data["summary"] == {
+        "total_enrollment": 50,
+        "total_seats": 50,
+        "total_sections": 2,
+        "fill_rate": 100.0,
+    }
+
+
+def test_parse_matches_read_excel_conversion(tmp_path):
+    # Numeric discipline codes stay "16" (not "16.0"), blank cells are
+    # skipped in sums, and the duplicate "Enrollment" header is renamed
+    # "Enrollment.1" so the first one is the enrollment column
+    path = write_workbook(
+        tmp_path / "Spring_2025_5-7-25.xlsx",
+        ["Discipline", "Mode", "Enrollment", "Enrollment", "Seats", "Sections"],
+        [
+            [16, "Online", 30, 99, 35, 1],
+            [16, "In-Person", 25, 99, 30, 1],
+            [22, "Online", 10, 99, None, 1],
+            [22, "Online", 5, 99, 10, 1],
+        ],
+    )
+
+    data = parse_enrollment_excel(path)
+
+    assert data == {
+        "summary": {
+            "total_enrollment": 70,
+            "total_seats": 75,
+            "total_sections": 4,
+            "fill_rate": 93.33,
+        },
+        "by_mode": {
+            "Online": {"enrollment": 45, "seats": 45, "sections": 3},
+            "In-Person": {"enrollment": 25, "seats": 30, "sections": 1},
+        },
+        "by_term_length": {},
+        "by_discipline": {
+            "16": {"enrollment": 55, "seats": 65, "sections": 2},
+            "22": {"enrollment": 15, "seats": 10, "sections": 2},
+        },
+        "by_credit_type": {},
+        "raw_records_count": 4,
+    }
+
+
+def test_parse_empty_sheet(tmp_path):
+    path = tmp_path / "Fall_2024 (11-13-24).xlsx"
+    Workbook().save(path)
+
+    data = parse_enrollment_excel(path)
+
+    assert data["summary"] == {}
+    assert data["raw_records_count"] == 0
+
+
+@pytest.mark.parametrize("value", ["0", "-5"])
+def test_batch_size_argument_rejects_values_below_one(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
+@pytest.mark.parametrize("batch_size", [0, -5])
+def test_load_rejects_batch_size_below_one(tmp_path, batch_size):
+    with pytest.raises(ValueError, match="batch_size"):
+        load_enrollment_data(tmp_path, batch_size=batch_size)
+
+
+def test_files_with_the_same_term_and_date_store_the_last_one(tmp_path, engine, monkeypatch):
+    monkeypatch.setattr(load_enrollment, "engine", engine)
+    header = ["Subject", "Enrollment"]
+    # Both names parse to ("Fall 2024", 2024-11-13); sorted, the underscore form is last
+    write_workbook(tmp_path / "Fall_2024 (11-13-24).xlsx", header, [["MATH", 10]])
+    write_workbook(tmp_path / "Fall_2024_11-13-24.xlsx", header, [["MATH", 20]])
+
+    load_enrollment_data(tmp_path, batch_size=1)
+    load_enrollment_data(tmp_path)
+
+    with Session(engine) as session:
+        rows = session.exec(select(EnrollmentSnapshot)).all()
+    assert len(rows) == 1
+    assert rows[0].data["summary"]["total_enrollment"] == 20
@@ -0,0 +1,196 @@
+"""
+Tests for the program review list endpoint.
+"""
+
+import base64
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session
+
+from database import get_session, get_write_session
+from models.organization import Organization, OrganizationType
+from models.program_review import ProgramReview, ReviewSection
+from models.user import User, UserRole
+from routers.reviews import _review_list_cache, invalidate_review_list_cache
+
+
+@pytest.fixture
+def reviews(session, department, admin_user):
+    """Five reviews in department, updated one day apart (newest last)."""
+    start = datetime(2025, 1, 1)
+    reviews = [
+        ProgramReview(
+            org_id=department.id,
+            author_id=admin_user.id,
+            cycle_year=f"{2020 + i}-{2021 + i}",
+            updated_at=start + timedelta(days=i),
+        )
+        for i in range(5)
+    ]
+    session.add_all(reviews)
+    session.commit()
+    return reviews
+
+
+def test_list_reviews_returns_all_as_list_by_default(client, reviews):
+    response = client.get("/api/reviews")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert isinstance(body, list)
+    assert [r["id"] for r in body] == [str(r.id) for r in reversed(reviews)]
+    assert body[0]["org_name"] == "Mathematics"
+    assert body[0]["author_name"] == "Test Admin"
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_reviews_cursor_round_trip(client, reviews):
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/reviews", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(r["id"] for r in page)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert seen == [str(r.id) for r in reversed(reviews)]
+
+
+def test_list_reviews_last_full_page_has_no_cursor(client, reviews):
+    response = client.get("/api/reviews", params={"limit": 5})
+
+    assert len(response.json()) == 5
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        base64.urlsafe_b64encode(b"no-separator").decode(),
+        base64.urlsafe_b64encode(b"yesterday|not-a-uuid").decode(),
+    ],
+)
+def test_list_reviews_invalid_cursor(client, reviews, cursor):
+    response = client.get("/api/reviews", params={"limit": 2, "cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_list_reviews_faculty_sees_only_own_department(client, session, reviews, department, admin_user):
+    other = Organization(name="English", type=OrganizationType.DEPARTMENT)
+    session.add(other)
+    session.commit()
+    other_review = ProgramReview(org_id=other.id, author_id=admin_user.id, cycle_year="2025-2026")
+    faculty = User(
+        firebase_uid="test-faculty",
+        email="faculty@test.edu",
+        full_name="Test Faculty",
+        role=UserRole.FACULTY,
+        department_id=other.id,
+    )
+    session.add_all([other_review, faculty])
+    session.commit()
+
+    all_ids = {r["id"] for r in client.get("/api/reviews").json()}
+    assert all_ids == {str(r.id) for r in reviews} | {str(other_review.id)}
+
+    client.user = faculty
+    response = client.get("/api/reviews")
+    assert [r["id"] for r in response.json()] == [str(other_review.id)]
+
+    # The department filter also applies when the faculty asks for another org
+    response = client.get("/api/reviews", params={"org_id": str(department.id)})
+    assert response.json() == []
+
+
+def test_write_handlers_return_committed_values(client, department):
+    response = client.post(
+        "/api/reviews",
+        json={"org_id": str(department.id), "cycle_year": "2025-2026"},
+    )
+    assert response.status_code == 201
+    created = response.json()
+    assert created["org_name"] == "Mathematics"
+    assert created["author_name"] == "Test Admin"
+    assert created["status"] == "draft"
+
+    review_url = f"/api/reviews/{created['id']}"
+    updated = client.patch(review_url, json={"content": {"overview": "Draft"}}).json()
+    assert updated["content"] == {"overview": "Draft"}
+    assert updated["updated_at"] > created["updated_at"]
+
+    submitted = client.post(f"{review_url}/submit").json()
+    assert submitted["status"] == "in_review"
+
+    section = client.patch(f"{review_url}/sections/curriculum", json={"content": "Text"}).json()
+    assert section["section_key"] == "curriculum"
+    assert section["content"] == "Text"
+
+    # What the handlers returned is what a fresh read sees
+    assert client.get(review_url).json() == submitted
+
+
+def test_only_write_sessions_skip_expire_on_commit():
+    sessions = get_session()
+    session = next(sessions)
+    try:
+        assert session.expire_on_commit
+        assert get_write_session(session) is session
+        assert not session.expire_on_commit
+    finally:
+        sessions.close()
+
+
+def test_review_collections_lazy_load(engine, reviews):
+    review = reviews[0]
+    with Session(engine) as session:
+        session.add(ReviewSection(review_id=review.id, section_key="curriculum"))
+        session.commit()
+
+        loaded = session.get(ProgramReview, review.id)
+        assert loaded.organization.name == "Mathematics"
+        assert [s.section_key for s in loaded.sections] == ["curriculum"]
+        assert loaded.action_plans == []
+        assert loaded.validation_scores == []
+
+
+def test_list_cache_serves_until_a_write_invalidates_it(client, session, reviews, department, admin_user):
+    assert len(client.get("/api/reviews").json()) == 5
+
+    # Written behind the API's back: the cached list is still served
+    session.add(ProgramReview(org_id=department.id, author_id=admin_user.id, cycle_year="2030-2031"))
+    session.commit()
+    assert len(client.get("/api/reviews").json()) == 5
+
+    # A write through the API drops cached lists that could include its org
+    client.patch(f"/api/reviews/{reviews[0].id}", json={"content": {"a": "b"}})
+    assert len(client.get("/api/reviews").json()) == 6
+
+
+def test_list_cache_invalidation_is_scoped_to_the_org(department):
+    other_org = uuid4()
+    _review_list_cache.clear()
+    _review_list_cache.update({
+        (None, None, None, None): "all",
+        (department.id, None, None, None): "dept",
+        (other_org, None, None, None): "other org",
+        (None, other_org, None, None): "other faculty",
+    })
+
+    invalidate_review_list_cache(department.id)
+
+    assert set(_review_list_cache.values()) == {"other org", "other faculty"}